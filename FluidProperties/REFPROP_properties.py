@@ -12,6 +12,18 @@ class ThermodynamicPoint(AbstractThermodynamicPoint):
         pass
 
 
+# REFPROP works in [MPa], [°C], [kJ/kg]: the conversion to / from SI is done
+# here only, as (scale, offset) with SI = REFPROP * scale + offset
+REFPROP_TO_SI = {
+
+    "P": (10 ** 6, 0.),
+    "T": (1., 273.15),
+    "h": (10 ** 3, 0.),
+    "s": (10 ** 3, 0.)
+
+}
+
+
 class REFPROPProperties(AbstractFluidProperties, ABC):
 
     def __init__(self, initial_volume, P_0, T_0):
@@ -19,16 +31,57 @@ class REFPROPProperties(AbstractFluidProperties, ABC):
         super().__init__(initial_volume, P_0, T_0)
 
         thermo_class = self.thermo_point_class
-        self.thermo_point = thermo_class(self.thermo_input)
+        self.refprop_handler = self.thermo_input
+        self.thermo_point = thermo_class(self.refprop_handler)
         self.init_properties()
 
     def set_variable(self, variable_name: str, variable_value: float):
 
+        if variable_name in REFPROP_TO_SI:
+
+            scale, offset = REFPROP_TO_SI[variable_name]
+            variable_value = (variable_value - offset) / scale
+
         self.thermo_point.set_variable(variable_name, variable_value)
 
     def get_variable(self, variable_name: str):
 
-        return self.thermo_point.get_variable(variable_name)
+        value = self.thermo_point.get_variable(variable_name)
+
+        if variable_name in REFPROP_TO_SI and value is not None:
+
+            scale, offset = REFPROP_TO_SI[variable_name]
+            return value * scale + offset
+
+        return value
+
+    def get_state(self) -> dict:
+
+        state = super().get_state()
+        state.update({
+
+            "h": self.get_variable("h"),
+            "rho": self.get_variable("rho")
+
+        })
+
+        return state
+
+    def fork(self):
+
+        # the REFPROP handler is shared, only the thermodynamic point is new
+        new_fluid = super().fork()
+        new_fluid.thermo_point = self.thermo_point_class(self.refprop_handler)
+        new_fluid.set_state(self.get_state())
+
+        return new_fluid
+
+    def set_state(self, state: dict):
+
+        super().set_state(state)
+
+        self.set_variable("h", state["h"])
+        self.set_variable("rho", state["rho"])
 
     @property
     def mass(self):
@@ -75,6 +128,7 @@ class AirProperties(REFPROPProperties):
         if new_mass < 0:
 
             self.__mass = 0
+            self.n_clamped += 1
 
         else:
 
@@ -87,14 +141,26 @@ class AirProperties(REFPROPProperties):
             if not d_mass == 0:
                 self.on_mass_update()
 
+    def get_state(self) -> dict:
+
+        state = super().get_state()
+        state["mass"] = self.__mass
+
+        return state
+
+    def set_state(self, state: dict):
+
+        self.__mass = state["mass"]
+        super().set_state(state)
+
     @property
     def thermo_input(self):
         return RefPropHandler(["Nitrogen", "Oxygen", "Argon"], [0.78, 0.21, 0.1])
 
     def init_properties(self):
 
-        self.thermo_point.set_variable("P", self.P_0)
-        self.thermo_point.set_variable("T", self.T_0)
+        self.set_variable("P", self.P_0)
+        self.set_variable("T", self.T_0)
 
     def on_vol_update(self, d_vol):
 
@@ -111,7 +177,7 @@ class AirProperties(REFPROPProperties):
 
     def calculate_dh(self, d_vol):
 
-        return - self.get_variable("P") * d_vol / self.mass * 10 ** 3
+        return - self.get_variable("P") * d_vol / self.mass
 
 
 class WaterProperties(REFPROPProperties):
@@ -128,8 +194,8 @@ class WaterProperties(REFPROPProperties):
 
     def init_properties(self):
 
-        self.thermo_point.set_variable("P", self.P_0)
-        self.thermo_point.set_variable("T", self.T_0)
+        self.set_variable("P", self.P_0)
+        self.set_variable("T", self.T_0)
 
     def on_vol_update(self, d_vol):
         pass
@@ -137,8 +203,8 @@ class WaterProperties(REFPROPProperties):
 
 if __name__ == '__main__':
 
-    tp = AirProperties(initial_volume=1, P_0=1, T_0=25)
+    tp = AirProperties(initial_volume=1, P_0=10 ** 6, T_0=298.15)
     print(tp.mass)
 
-    tp = WaterProperties(initial_volume=1, P_0=1, T_0=25)
+    tp = WaterProperties(initial_volume=1, P_0=10 ** 6, T_0=298.15)
     print(tp.mass)
\ No newline at end of file
@@ -1,13 +1,16 @@
 from abc import ABC, abstractmethod
+import copy
 
 
 class AbstractFluidProperties(ABC):
 
     def __init__(self, initial_volume, P_0, T_0):
 
+        # all the quantities are stored in SI units: [m^3], [Pa], [K], [kg]
         self.name = ""
 
         self.__vol = initial_volume
+        self.n_clamped = 0
         self.V_0 = initial_volume
         self.P_0 = P_0
         self.T_0 = T_0
@@ -22,6 +25,31 @@ class AbstractFluidProperties(ABC):
 
         pass
 
+    def get_state(self) -> dict:
+
+        return {
+
+            "vol": self.__vol,
+            "V_0": self.V_0,
+            "P_0": self.P_0,
+            "T_0": self.T_0,
+            "n_clamped": self.n_clamped
+
+        }
+
+    def fork(self):
+
+        return copy.copy(self)
+
+    def set_state(self, state: dict):
+
+        # the volume is restored directly, without triggering on_vol_update
+        self.__vol = state["vol"]
+        self.V_0 = state["V_0"]
+        self.P_0 = state["P_0"]
+        self.T_0 = state["T_0"]
+        self.n_clamped = state["n_clamped"]
+
     @property
     def vol(self):
 
@@ -35,6 +63,7 @@ class AbstractFluidProperties(ABC):
         if new_vol < 0:
 
             self.__vol = 0
+            self.n_clamped += 1
 
         else:
 
@@ -9,9 +9,6 @@ class IdealProperties(AbstractFluidProperties, ABC):
 
         super().__init__(initial_volume, P_0, T_0)
 
-        self.P_0 *= 1000    # MPa -> kPa
-        self.T_0 += 273.15  # °C -> K
-
         self.__P = self.P_0
         self.__T = self.T_0
 
@@ -30,6 +27,7 @@ class IdealProperties(AbstractFluidProperties, ABC):
         if new_mass < 0:
 
             self.__mass = 0
+            self.n_clamped += 1
 
         else:
 
@@ -43,6 +41,27 @@ class IdealProperties(AbstractFluidProperties, ABC):
 
                 self.on_mass_update()
 
+    def get_state(self) -> dict:
+
+        state = super().get_state()
+        state.update({
+
+            "P": self.__P,
+            "T": self.__T,
+            "mass": self.__mass
+
+        })
+
+        return state
+
+    def set_state(self, state: dict):
+
+        super().set_state(state)
+
+        self.__P = state["P"]
+        self.__T = state["T"]
+        self.__mass = state["mass"]
+
     def get_variable(self, variable_name: str):
 
         if variable_name == "rho":
@@ -51,21 +70,16 @@ class IdealProperties(AbstractFluidProperties, ABC):
 
         elif variable_name == "P":
 
-            return self.__P / 10 ** 3  # kPa -> MPa
+            return self.__P
 
         elif variable_name == "T":
 
-            return self.__T - 273.15  # K -> °C
+            return self.__T
 
         else:
 
-            try:
-
-                return self.properties[variable_name]
-
-            except:
-
-                return None
+            # None for the properties the backend does not define
+            return self.properties.get(variable_name)
 
     def set_variable(self, variable_name: str, value):
 
@@ -75,11 +89,11 @@ class IdealProperties(AbstractFluidProperties, ABC):
 
         elif variable_name == "P":
 
-            self.__P = value * 10 ** 3  # MPa -> kPa
+            self.__P = value
 
         elif variable_name == "T":
 
-            self.__T = value + 273.15  # °C -> K
+            self.__T = value
 
     @abstractmethod
     def on_mass_update(self):
@@ -96,15 +110,18 @@ class IdealProperties(AbstractFluidProperties, ABC):
     @abstractmethod
     def properties(self):
 
-        return {
+        pass
 
-            "gamma": 1.4,
-            "R": 0.287
 
-        }
+class AirPropertiesIdeal(IdealProperties):
 
+    # SI units, the dict is shared so that no new one is built at every access
+    PROPERTIES = {
 
-class AirPropertiesIdeal(IdealProperties):
+        "gamma": 1.4,
+        "R": 287.     # [J/(kg K)]
+
+    }
 
     def __init__(self, initial_volume, P_0, T_0):
 
@@ -115,36 +132,35 @@ class AirPropertiesIdeal(IdealProperties):
     def on_vol_update(self, d_vol):
 
         gamma = self.properties["gamma"]
-        self.set_variable("P", self.P_0 * np.power(self.vol / self.V_0, - gamma) / 10 ** 3)
-        self.set_variable("T", self.T_0 * np.power(self.vol / self.V_0, 1 - gamma) - 273.15)
+        self.set_variable("P", self.P_0 * np.power(self.vol / self.V_0, - gamma))
+        self.set_variable("T", self.T_0 * np.power(self.vol / self.V_0, 1 - gamma))
 
     def on_mass_update(self):
 
         rho = self.mass / self.vol
         R = self.properties["R"]
-        T = self.get_variable("T") + 273.15
+        T = self.get_variable("T")
 
-        self.set_variable("P", rho * R * T / 10 ** 3)
+        self.set_variable("P", rho * R * T)
 
     @property
     def rho(self):
 
-        P = self.get_variable("P") * 1000
-        T = self.get_variable("T") + 273.15
-        return P / (self.properties["R"] * T)
+        return self.get_variable("P") / (self.properties["R"] * self.get_variable("T"))
 
     @property
     def properties(self):
 
-        return {
+        return self.PROPERTIES
 
-            "gamma": 1.4,
-            "R": 0.287
 
-        }
+class WaterPropertiesIdeal(IdealProperties):
 
+    PROPERTIES = {
 
-class WaterPropertiesIdeal(IdealProperties):
+        "rho": 997.   # [kg/m^3]
+
+    }
 
     def __init__(self, initial_volume, P_0, T_0):
         super().__init__(initial_volume, P_0, T_0)
@@ -166,14 +182,10 @@ class WaterPropertiesIdeal(IdealProperties):
     @property
     def properties(self):
 
-        return {
-
-            "rho": 997
-
-        }
+        return self.PROPERTIES
 
 
 if __name__ == "__main__":
 
-    ip = AirPropertiesIdeal(initial_volume=1, P_0=0.1, T_0=25)
+    ip = AirPropertiesIdeal(initial_volume=1, P_0=0.1 * 10 ** 6, T_0=25 + 273.15)
     print(ip.get_variable("rho"))
\ No newline at end of file
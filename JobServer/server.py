@@ -0,0 +1,331 @@
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from concurrent.futures import ProcessPoolExecutor, Future
+import urllib.request
+import numpy as np
+import threading
+import queue
+import json
+import time
+import os
+
+
+def _warm_worker(rocket_names):
+
+    # imports the rocket / fluid classes once per worker process, so that the
+    # requests do not pay for it
+    from RocketModel.Support.sweep import ROCKET_CLASSES, import_from_path
+
+    for name in rocket_names:
+
+        for path in ROCKET_CLASSES[name]:
+
+            import_from_path(path)
+
+
+def _run_batch(configs, trajectory_dir):
+
+    from RocketModel.Support.sweep import build_rocket, summarize, point_key
+    import numpy as np
+
+    results = list()
+
+    for config, save_trajectory in configs:
+
+        try:
+
+            rocket = build_rocket(config)
+            rocket.calculate()
+
+            result = {"summary": summarize(rocket)}
+
+            if save_trajectory and trajectory_dir is not None:
+
+                path = os.path.join(trajectory_dir, "{}.npz".format(point_key(config)))
+                np.savez(path, **rocket.trajectory.as_dict())
+                result["trajectory"] = path
+
+        except Exception as error:
+
+            # a failing configuration must not bring down the whole batch
+            result = {"error": "{}: {}".format(type(error).__name__, error)}
+
+        results.append(result)
+
+    return results
+
+
+class RequestBatcher:
+
+    """
+        Collects the configurations coming from concurrent requests (at most
+        max_batch configurations, waiting at most max_wait [s] after the first
+        one). Each batch is split into one chunk per worker: the chunks are the
+        IPC round trips, and all the warm workers run in parallel.
+    """
+
+    def __init__(self, executor, n_workers, max_batch=32, max_wait=0.02, trajectory_dir=None):
+
+        self.executor = executor
+        self.n_workers = max(int(n_workers), 1)
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.trajectory_dir = trajectory_dir
+
+        self.__queue = queue.Queue()
+        self.__thread = threading.Thread(target=self.__loop, daemon=True)
+        self.__thread.start()
+
+    def submit(self, config: dict, save_trajectory=False) -> Future:
+
+        future = Future()
+        self.__queue.put((config, save_trajectory, future))
+        return future
+
+    def close(self):
+
+        self.__queue.put(None)
+        self.__thread.join()
+
+    def __loop(self):
+
+        while True:
+
+            item = self.__queue.get()
+
+            if item is None:
+                return
+
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+
+            while len(batch) < self.max_batch:
+
+                timeout = deadline - time.monotonic()
+
+                if timeout <= 0:
+                    break
+
+                try:
+
+                    item = self.__queue.get(timeout=timeout)
+
+                except queue.Empty:
+
+                    break
+
+                if item is None:
+
+                    self.__dispatch(batch)
+                    return
+
+                batch.append(item)
+
+            self.__dispatch(batch)
+
+    def __dispatch(self, batch):
+
+        n_chunks = min(self.n_workers, len(batch))
+        chunk_size = int(np.ceil(len(batch) / n_chunks))
+
+        for i in range(0, len(batch), chunk_size):
+
+            self.__dispatch_chunk(batch[i:i + chunk_size])
+
+    def __dispatch_chunk(self, batch):
+
+        configs = [(config, save_trajectory) for config, save_trajectory, future in batch]
+        futures = [future for config, save_trajectory, future in batch]
+
+        def on_done(batch_future):
+
+            try:
+
+                results = batch_future.result()
+
+            except Exception as error:
+
+                for future in futures:
+                    future.set_exception(error)
+
+                return
+
+            for future, result in zip(futures, results):
+                future.set_result(result)
+
+        self.executor.submit(_run_batch, configs, self.trajectory_dir).add_done_callback(on_done)
+
+
+class SimulationServer:
+
+    """
+        Local HTTP service running rocket configurations on a persistent pool of
+        warm worker processes.
+
+            POST /simulate   {"configs": [config, ...], "trajectory": false}
+                             -> {"results": [{"summary": ...} | {"error": ...}, ...]}
+            GET  /health     -> {"status": "ok"}
+
+        configs follow RocketModel.Support.sweep.build_rocket.
+    """
+
+    def __init__(
+
+            self, host="127.0.0.1", port=8765, n_workers=None,
+            trajectory_dir=None, max_batch=32, max_wait=0.02,
+            warm_rockets=("ideal",)
+
+    ):
+
+        if trajectory_dir is not None:
+            os.makedirs(trajectory_dir, exist_ok=True)
+
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+
+        self.executor = ProcessPoolExecutor(
+
+            max_workers=n_workers,
+            initializer=_warm_worker,
+            initargs=(tuple(warm_rockets),)
+
+        )
+
+        self.batcher = RequestBatcher(
+
+            self.executor, n_workers, max_batch=max_batch,
+            max_wait=max_wait, trajectory_dir=trajectory_dir
+
+        )
+
+        self.httpd = ThreadingHTTPServer((host, port), self.__handler_class())
+
+    def __handler_class(self):
+
+        batcher = self.batcher
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+
+                if self.path == "/health":
+
+                    self.__send(200, {"status": "ok"})
+
+                else:
+
+                    self.__send(404, {"error": "unknown path"})
+
+            def do_POST(self):
+
+                if not self.path == "/simulate":
+
+                    self.__send(404, {"error": "unknown path"})
+                    return
+
+                try:
+
+                    length = int(self.headers.get("Content-Length", 0))
+                    request = json.loads(self.rfile.read(length))
+
+                    if not isinstance(request, dict):
+                        raise TypeError("the request must be a JSON object")
+
+                    configs = request["configs"]
+
+                    if not (isinstance(configs, list) and all(isinstance(config, dict) for config in configs)):
+                        raise TypeError("\"configs\" must be a list of objects")
+
+                except (ValueError, KeyError, TypeError) as error:
+
+                    self.__send(400, {"error": "invalid request: {}".format(error)})
+                    return
+
+                save_trajectory = bool(request.get("trajectory", False))
+                futures = [batcher.submit(config, save_trajectory) for config in configs]
+
+                try:
+
+                    results = [future.result() for future in futures]
+
+                except Exception as error:
+
+                    # e.g. a worker process died, the whole chunk is lost
+                    self.__send(500, {"error": "{}: {}".format(type(error).__name__, error)})
+                    return
+
+                self.__send(200, {"results": results})
+
+            def __send(self, code, body):
+
+                data = json.dumps(body).encode()
+
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    @property
+    def address(self):
+
+        host, port = self.httpd.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+    def serve_forever(self):
+
+        self.httpd.serve_forever()
+
+    def shutdown(self):
+
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.batcher.close()
+        self.executor.shutdown()
+
+
+def submit(configs, url="http://127.0.0.1:8765", trajectory=False, timeout=None):
+
+    request = urllib.request.Request(
+
+        "{}/simulate".format(url),
+        data=json.dumps({"configs": list(configs), "trajectory": trajectory}).encode(),
+        headers={"Content-Type": "application/json"}
+
+    )
+
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())["results"]
+
+
+if __name__ == "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="local water rocket simulation server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--trajectory-dir", default=None)
+    args = parser.parse_args()
+
+    server = SimulationServer(
+
+        host=args.host, port=args.port, n_workers=args.workers,
+        trajectory_dir=args.trajectory_dir
+
+    )
+
+    print("serving on {}".format(server.address))
+
+    try:
+
+        server.serve_forever()
+
+    except KeyboardInterrupt:
+
+        server.shutdown()
@@ -0,0 +1,91 @@
+from RocketModel.Aerodynamics.tables import UniformTable
+from RocketModel.constants import g
+from functools import lru_cache
+import numpy as np
+
+
+R_AIR = 287.05287   # [J/(kg K)]
+GAMMA_AIR = 1.4
+
+
+def isa_state(z):
+
+    """
+        International Standard Atmosphere up to 20 km (troposphere and isothermal
+        lower stratosphere). z is the geopotential altitude [m], returns
+        temperature [K], pressure [Pa], density [kg/m^3], speed of sound [m/s]
+        and dynamic viscosity [Pa s].
+    """
+
+    z = np.asarray(z, dtype=float)
+
+    T_0, P_0, L = 288.15, 101325., 0.0065
+    z_trop = 11000.
+    T_trop = T_0 - L * z_trop
+    P_trop = P_0 * np.power(T_trop / T_0, g / (R_AIR * L))
+
+    T = np.where(z < z_trop, T_0 - L * z, T_trop)
+    P = np.where(
+
+        z < z_trop,
+        P_0 * np.power(T / T_0, g / (R_AIR * L)),
+        P_trop * np.exp(-g * (z - z_trop) / (R_AIR * T_trop))
+
+    )
+
+    rho = P / (R_AIR * T)
+    a = np.sqrt(GAMMA_AIR * R_AIR * T)
+    mu = 1.458e-6 * np.power(T, 1.5) / (T + 110.4)  # Sutherland
+
+    return T, P, rho, a, mu
+
+
+@lru_cache(maxsize=16)
+def _build_isa_tables(z_min, z_max, n_table):
+
+    z_points = np.linspace(z_min, z_max, n_table)
+    T, P, rho, a, mu = isa_state(z_points)
+
+    return {
+
+        "T": UniformTable(z_points, T, n_table),
+        "P": UniformTable(z_points, P, n_table),
+        "rho": UniformTable(z_points, rho, n_table),
+        "a": UniformTable(z_points, a, n_table),
+        "mu": UniformTable(z_points, mu, n_table)
+
+    }
+
+
+class ISAAtmosphere:
+
+    """
+        Tabulated ISA properties as a function of the flight altitude z [m] above
+        the launch site (placed at z_launch [m] above sea level). The tables are
+        shared between all the instances with the same range.
+    """
+
+    def __init__(self, z_launch=0., z_range=5000., n_table=2048):
+
+        self.z_launch = z_launch
+        self.__tables = _build_isa_tables(float(z_launch), float(z_launch + z_range), int(n_table))
+
+        self.__rho = self.__tables["rho"]
+        self.__a = self.__tables["a"]
+        self.__mu = self.__tables["mu"]
+
+    def get_variable(self, variable_name: str, z):
+
+        return self.__tables[variable_name](z + self.z_launch)
+
+    def rho(self, z):
+
+        return self.__rho(z + self.z_launch)
+
+    def speed_of_sound(self, z):
+
+        return self.__a(z + self.z_launch)
+
+    def mu(self, z):
+
+        return self.__mu(z + self.z_launch)
@@ -0,0 +1,84 @@
+from RocketModel.Aerodynamics.tables import UniformTable, UniformTable2D
+from RocketModel.Aerodynamics.atmosphere import ISAAtmosphere
+import numpy as np
+
+
+# indicative compressibility correction Cd(Mach) / Cd(0) for a blunt body,
+# water rockets rarely go beyond Mach 0.3 where the correction is negligible
+DEFAULT_MACH_POINTS = [0., 0.3, 0.6, 0.8, 0.9, 1.0, 1.2, 2.0]
+DEFAULT_MACH_FACTORS = [1., 1., 1.03, 1.1, 1.3, 1.8, 1.9, 1.7]
+
+
+class CdTable:
+
+    """
+        Drag coefficient correction as a function of Mach and, optionally, of the
+        Reynolds number (in that case "factors" has shape (n_mach, n_re) and the
+        table is interpolated on log10(Re)). The result multiplies geometry.Cd.
+    """
+
+    def __init__(self, mach_points=None, factors=None, re_points=None, n_table=512):
+
+        if mach_points is None:
+
+            mach_points = DEFAULT_MACH_POINTS
+            factors = DEFAULT_MACH_FACTORS
+
+        self.use_re = re_points is not None
+
+        if self.use_re:
+
+            self.__table = UniformTable2D(mach_points, np.log10(re_points), factors, n_table=n_table)
+
+        else:
+
+            self.__table = UniformTable(mach_points, factors, n_table=n_table)
+
+    def __call__(self, mach, re=None):
+
+        if self.use_re:
+
+            if isinstance(re, (float, int)):
+                return self.__table(mach, np.log10(re) if re > 0 else 0.)
+
+            return self.__table(mach, np.log10(np.maximum(re, 1.)))
+
+        return self.__table(mach)
+
+
+class DragModel:
+
+    """
+        Aerodynamic drag F = - 1/2 rho Cd A_max v |v| [N]. z [m] and v [m/s] can
+        be floats (step loop) or numpy arrays (batches of rockets or trajectories).
+    """
+
+    def __init__(self, geometry, atmosphere: ISAAtmosphere = None, cd_table: CdTable = None):
+
+        if atmosphere is None:
+            atmosphere = ISAAtmosphere()
+
+        if cd_table is None:
+            cd_table = CdTable()
+
+        self.geom = geometry
+        self.atmosphere = atmosphere
+        self.cd_table = cd_table
+
+    def cd(self, z, v):
+
+        speed = abs(v)
+        mach = speed / self.atmosphere.speed_of_sound(z)
+
+        if self.cd_table.use_re:
+
+            rho = self.atmosphere.rho(z)
+            re = rho * speed * self.geom.d_max / self.atmosphere.mu(z)
+            return self.geom.Cd * self.cd_table(mach, re)
+
+        return self.geom.Cd * self.cd_table(mach)
+
+    def force(self, z, v):
+
+        rho = self.atmosphere.rho(z)
+        return - 0.5 * rho * self.cd(z, v) * self.geom.A_max * v * abs(v)
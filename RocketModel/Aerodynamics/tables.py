@@ -0,0 +1,110 @@
+import numpy as np
+
+
+class UniformTable:
+
+    """
+        1D table sampled on a uniform grid. Scalar queries compute the grid index
+        directly (no search, no numpy call), arrays go through np.interp. Queries
+        outside the grid are clamped to the first / last value.
+    """
+
+    def __init__(self, x_points, y_points, n_table=2048):
+
+        x_points = np.asarray(x_points, dtype=float)
+        y_points = np.asarray(y_points, dtype=float)
+
+        self.x_min = float(x_points[0])
+        self.x_max = float(x_points[-1])
+
+        self.x_grid = np.linspace(self.x_min, self.x_max, n_table)
+        self.y_grid = np.interp(self.x_grid, x_points, y_points)
+
+        self.__y_list = self.y_grid.tolist()
+        self.__dx = self.x_grid[1] - self.x_grid[0]
+        self.__n_last = n_table - 1
+
+    def __call__(self, x):
+
+        if isinstance(x, (float, int)):
+
+            pos = (x - self.x_min) / self.__dx
+            y_list = self.__y_list
+
+            if pos <= 0:
+                return y_list[0]
+
+            i = int(pos)
+
+            if i >= self.__n_last:
+                return y_list[-1]
+
+            return y_list[i] + (pos - i) * (y_list[i + 1] - y_list[i])
+
+        return np.interp(x, self.x_grid, self.y_grid)
+
+
+class UniformTable2D:
+
+    """
+        2D table f(x, y) on a uniform grid with bilinear interpolation, clamped at
+        the borders. "values" has shape (len(x_points), len(y_points)).
+    """
+
+    def __init__(self, x_points, y_points, values, n_table=256):
+
+        x_points = np.asarray(x_points, dtype=float)
+        y_points = np.asarray(y_points, dtype=float)
+        values = np.asarray(values, dtype=float)
+
+        self.x_min, self.x_max = float(x_points[0]), float(x_points[-1])
+        self.y_min, self.y_max = float(y_points[0]), float(y_points[-1])
+
+        x_grid = np.linspace(self.x_min, self.x_max, n_table)
+        y_grid = np.linspace(self.y_min, self.y_max, n_table)
+
+        # resample along y first and then along x (separable linear interpolation)
+        along_y = np.array([np.interp(y_grid, y_points, row) for row in values])
+        self.grid = np.array([np.interp(x_grid, x_points, column) for column in along_y.T]).T
+
+        self.__grid_list = self.grid.tolist()
+        self.__dx = x_grid[1] - x_grid[0]
+        self.__dy = y_grid[1] - y_grid[0]
+        self.__n_last = n_table - 1
+
+    def __call__(self, x, y):
+
+        if isinstance(x, (float, int)) and isinstance(y, (float, int)):
+
+            i, fx = self.__scalar_index((x - self.x_min) / self.__dx)
+            j, fy = self.__scalar_index((y - self.y_min) / self.__dy)
+
+            grid = self.__grid_list
+            low = grid[i][j] + fy * (grid[i][j + 1] - grid[i][j])
+            high = grid[i + 1][j] + fy * (grid[i + 1][j + 1] - grid[i + 1][j])
+
+            return low + fx * (high - low)
+
+        pos_x = np.clip((np.asarray(x, dtype=float) - self.x_min) / self.__dx, 0, self.__n_last)
+        pos_y = np.clip((np.asarray(y, dtype=float) - self.y_min) / self.__dy, 0, self.__n_last)
+
+        i = np.minimum(pos_x.astype(int), self.__n_last - 1)
+        j = np.minimum(pos_y.astype(int), self.__n_last - 1)
+        fx = pos_x - i
+        fy = pos_y - j
+
+        low = self.grid[i, j] + fy * (self.grid[i, j + 1] - self.grid[i, j])
+        high = self.grid[i + 1, j] + fy * (self.grid[i + 1, j + 1] - self.grid[i + 1, j])
+
+        return low + fx * (high - low)
+
+    def __scalar_index(self, pos):
+
+        if pos <= 0:
+            return 0, 0.
+
+        if pos >= self.__n_last:
+            return self.__n_last - 1, 1.
+
+        i = int(pos)
+        return i, pos - i
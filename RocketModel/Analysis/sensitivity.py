@@ -0,0 +1,198 @@
+from RocketModel.Support.sweep import Sweep
+import numpy as np
+import copy
+
+
+# where each design parameter goes in a sweep configuration (see build_rocket)
+GEOMETRY_PARAMETERS = ("Cd", "d_nozzle", "d_max", "m_bottle", "V_bottle")
+STATUS_PARAMETERS = ("P_0", "T_0", "fill_start")
+
+DEFAULT_BOUNDS = {
+
+    "Cd": (0.3, 0.8),
+    "d_nozzle": (0.01, 0.025),
+    "m_bottle": (0.03, 0.15),
+    "V_bottle": (0.5, 2.0),
+    "P_0": (0.3, 0.8),
+    "fill_start": (0.1, 0.6)
+
+}
+
+BASE_CONFIG = {"rocket": "drag", "P_0": 0.5, "T_0": 25, "fill_start": 0.3}
+
+
+def make_config(base_config: dict, names, values):
+
+    config = copy.deepcopy(base_config)
+
+    for name, value in zip(names, values):
+
+        if name in GEOMETRY_PARAMETERS:
+
+            config.setdefault("geometry", dict())[name] = float(value)
+
+        elif name in STATUS_PARAMETERS:
+
+            config[name] = float(value)
+
+        else:
+
+            raise ValueError("unknown design parameter: {}".format(name))
+
+    return config
+
+
+def scale_samples(unit_samples, bounds: dict):
+
+    low = np.array([bounds[name][0] for name in bounds.keys()])
+    high = np.array([bounds[name][1] for name in bounds.keys()])
+    return low + unit_samples * (high - low)
+
+
+def evaluate(samples, names, base_config=BASE_CONFIG, output="z_max", n_workers=1, checkpoint_dir=None):
+
+    """
+        Runs one rocket per row of "samples" through a Sweep. With a checkpoint_dir
+        the results are cached by configuration, so points shared between
+        designs (or runs interrupted and restarted) are computed only once.
+    """
+
+    configs = [make_config(base_config, names, row) for row in samples]
+    summaries = Sweep(configs, checkpoint_dir=checkpoint_dir).run(n_workers=n_workers)
+    return np.array([summary[output] for summary in summaries])
+
+
+def morris_design(n_params, n_trajectories, n_levels=4, seed=None):
+
+    """
+        Morris one-at-a-time trajectories in the unit cube. Returns the points,
+        shape (n_trajectories * (n_params + 1), n_params), and for each step the
+        index of the parameter that changed and the signed step length.
+    """
+
+    rng = np.random.default_rng(seed)
+    delta = n_levels / (2 * (n_levels - 1))
+    base_levels = np.arange(n_levels // 2) / (n_levels - 1)
+
+    points = list()
+    changed = list()
+
+    for i in range(n_trajectories):
+
+        x = rng.choice(base_levels, size=n_params)
+        directions = rng.choice([-1, 1], size=n_params)
+
+        # start from the opposite side for the parameters that move downward
+        x = np.where(directions < 0, x + delta, x)
+        points.append(x.copy())
+
+        for j in rng.permutation(n_params):
+
+            x[j] += directions[j] * delta
+            points.append(x.copy())
+            changed.append((j, directions[j] * delta))
+
+    return np.array(points), changed
+
+
+def morris_screening(
+
+        bounds: dict = None, n_trajectories=10, n_levels=4,
+        base_config=BASE_CONFIG, output="z_max", n_workers=1,
+        checkpoint_dir=None, seed=None
+
+):
+
+    if bounds is None:
+        bounds = DEFAULT_BOUNDS
+
+    names = list(bounds.keys())
+    n_params = len(names)
+
+    unit_samples, changed = morris_design(n_params, n_trajectories, n_levels=n_levels, seed=seed)
+    y = evaluate(scale_samples(unit_samples, bounds), names, base_config, output, n_workers, checkpoint_dir)
+
+    effects = [list() for name in names]
+
+    for t in range(n_trajectories):
+
+        for s in range(n_params):
+
+            i = t * (n_params + 1) + s
+            j, step = changed[t * n_params + s]
+            effects[j].append((y[i + 1] - y[i]) / step)
+
+    ranking = [
+
+        {
+
+            "parameter": name,
+            "mu_star": float(np.mean(np.abs(effect))),
+            "mu": float(np.mean(effect)),
+            "sigma": float(np.std(effect))
+
+        }
+        for name, effect in zip(names, effects)
+
+    ]
+
+    return sorted(ranking, key=lambda entry: entry["mu_star"], reverse=True)
+
+
+def sobol_indices(
+
+        bounds: dict = None, n_base=64,
+        base_config=BASE_CONFIG, output="z_max", n_workers=1,
+        checkpoint_dir=None, seed=None
+
+):
+
+    """
+        First order (Saltelli 2010) and total (Jansen) Sobol indices from
+        n_base * (n_params + 2) runs on a scrambled Sobol sequence (n_base
+        should be a power of 2).
+    """
+
+    from scipy.stats import qmc
+
+    if bounds is None:
+        bounds = DEFAULT_BOUNDS
+
+    names = list(bounds.keys())
+    n_params = len(names)
+
+    base = qmc.Sobol(d=2 * n_params, scramble=True, seed=seed).random(n_base)
+    A = base[:, :n_params]
+    B = base[:, n_params:]
+
+    AB = np.tile(A, (n_params, 1, 1))
+    for i in range(n_params):
+        AB[i, :, i] = B[:, i]
+
+    unit_samples = np.concatenate([A, B] + list(AB))
+    y = evaluate(scale_samples(unit_samples, bounds), names, base_config, output, n_workers, checkpoint_dir)
+
+    y_A = y[:n_base]
+    y_B = y[n_base:2 * n_base]
+    y_AB = y[2 * n_base:].reshape((n_params, n_base))
+    variance = np.var(np.concatenate((y_A, y_B)))
+
+    ranking = list()
+
+    for i, name in enumerate(names):
+
+        ranking.append({
+
+            "parameter": name,
+            "S1": float(np.mean(y_B * (y_AB[i] - y_A)) / variance),
+            "ST": float(0.5 * np.mean(np.power(y_A - y_AB[i], 2)) / variance)
+
+        })
+
+    return sorted(ranking, key=lambda entry: entry["ST"], reverse=True)
+
+
+if __name__ == "__main__":
+
+    for entry in morris_screening(n_trajectories=10, n_workers=None, seed=0):
+        print("{:<12} mu* = {:.3e}  sigma = {:.3e}".format(entry["parameter"], entry["mu_star"], entry["sigma"]))
@@ -0,0 +1,175 @@
+from RocketModel.Implementations.ideal_rocket import IdealRocketGeometry
+from RocketModel.Support.trajectory import TrajectoryRecorder
+import numpy as np
+
+
+class BottleStatus:
+
+    """
+        Bottle content (liquid + pressurised gas) for a given pair of fluid
+        property classes, without any rocket dynamics. P_0 [Pa], T_0 [K].
+    """
+
+    def __init__(self, liquid_class, gas_class, P_0, T_0, fill_start, geometry=None):
+
+        if geometry is None:
+            geometry = IdealRocketGeometry()
+
+        self.geom = geometry
+        self.P_in = P_0
+
+        liquid_volume = self.geom.V_bottle_m3 * fill_start
+        gas_volume = self.geom.V_bottle_m3 * (1 - fill_start)
+
+        self.liquid = liquid_class(liquid_volume, P_0, T_0)
+        self.gas = gas_class(gas_volume, P_0, T_0)
+
+    def step(self, dt, m_dot):
+
+        m_out = m_dot * dt
+
+        self.liquid.vol -= m_out / self.liquid.get_variable("rho")
+        self.gas.vol = self.geom.V_bottle_m3 - self.liquid.vol
+
+    @property
+    def is_empty(self):
+
+        return self.liquid.vol <= 0
+
+    @property
+    def m_tot(self):
+
+        mass = self.geom.m_bottle
+        for fluid in [self.liquid, self.gas]:
+
+            mass += fluid.mass
+
+        return mass
+
+
+class BackendComparison:
+
+    """
+        Runs the same initial state through several fluid backends in lockstep on
+        a shared time grid. Only the shared grid (time and gas volume of the
+        reference) and the deviation of each backend from the reference are stored.
+
+        "backends" is a dict {name: (liquid_class, gas_class)}, the first entry is
+        used as reference unless "reference" is given. P_0 [MPa] and T_0 [°C] as
+        for the rockets, the recorded values are in SI units.
+    """
+
+    def __init__(
+
+            self, backends: dict, P_0, T_0, fill_start,
+            geometry=None, reference=None, variables=("P", "rho")
+
+    ):
+
+        if len(backends) < 2:
+            raise ValueError("at least two backends are needed for a comparison")
+
+        self.reference = reference if reference is not None else next(iter(backends))
+        self.variables = list(variables)
+
+        self.status = {
+
+            name: BottleStatus(
+
+                liquid_class, gas_class,
+                P_0 * 10 ** 6, T_0 + 273.15,
+                fill_start, geometry=geometry
+
+            )
+            for name, (liquid_class, gas_class) in backends.items()
+
+        }
+
+        self.__time = 0.
+        self.grid = TrajectoryRecorder(["time", "vol"] + ["ref_{}".format(var) for var in self.variables])
+        self.divergence = {
+
+            name: TrajectoryRecorder(self.variables)
+            for name in self.status.keys() if not name == self.reference
+
+        }
+
+        self.__append_rows()
+
+    def run(self, dt, m_dot, n_steps):
+
+        for i in range(n_steps):
+
+            if self.status[self.reference].is_empty:
+                break
+
+            self.step(dt, m_dot)
+
+    def step(self, dt, m_dot):
+
+        self.__time += dt
+
+        for status in self.status.values():
+            status.step(dt, m_dot)
+
+        self.__append_rows()
+
+    def __append_rows(self):
+
+        ref_status = self.status[self.reference]
+        ref_values = [ref_status.gas.get_variable(var) for var in self.variables]
+
+        self.grid.append([self.__time, ref_status.gas.vol] + ref_values)
+
+        for name, recorder in self.divergence.items():
+
+            gas = self.status[name].gas
+            recorder.append([gas.get_variable(var) - ref for var, ref in zip(self.variables, ref_values)])
+
+    def relative_divergence(self, name, variable="P"):
+
+        ref_values = self.grid["ref_{}".format(variable)]
+        return np.abs(self.divergence[name][variable]) / np.maximum(np.abs(ref_values), np.finfo(float).tiny)
+
+    def max_deviation(self):
+
+        report = dict()
+
+        for name, recorder in self.divergence.items():
+
+            report[name] = dict()
+
+            for variable in self.variables:
+
+                rel_div = self.relative_divergence(name, variable)
+                i_max = int(np.argmax(rel_div))
+
+                report[name][variable] = {
+
+                    "abs": float(recorder[variable][i_max]),
+                    "rel": float(rel_div[i_max]),
+                    "time": float(self.grid["time"][i_max]),
+                    "vol": float(self.grid["vol"][i_max])
+
+                }
+
+        return report
+
+    def valid_until(self, name, rel_tol, variable="P"):
+
+        """
+            Returns the last reference gas volume for which the relative deviation of
+            backend "name" stays below rel_tol (None if it is exceeded from the start).
+        """
+
+        exceeded = np.nonzero(self.relative_divergence(name, variable) > rel_tol)[0]
+
+        if len(exceeded) == 0:
+
+            return float(self.grid["vol"][-1])
+
+        elif exceeded[0] == 0:
+
+            return None
+
+        return float(self.grid["vol"][exceeded[0] - 1])
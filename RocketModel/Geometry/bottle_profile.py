@@ -0,0 +1,211 @@
+from RocketModel.abstract_classes import AbstractRocketGeometry
+from functools import lru_cache
+import numpy as np
+
+
+@lru_cache(maxsize=64)
+def _build_tables(h_points: tuple, r_points: tuple, n_table: int):
+
+    h_points = np.asarray(h_points, dtype=float)
+    r_points = np.asarray(r_points, dtype=float)
+
+    if np.any(np.diff(h_points) <= 0):
+        raise ValueError("profile heights must be strictly increasing")
+
+    if np.any(r_points <= 0):
+        raise ValueError("profile radii must be positive")
+
+    # volume as a function of height (trapezoidal integration of the section area
+    # on a fine grid, the radius is linear between two profile points)
+    h_fine = np.linspace(h_points[0], h_points[-1], 8 * n_table)
+    area = np.pi * np.power(np.interp(h_fine, h_points, r_points), 2)
+    vol_fine = np.concatenate(([0.], np.cumsum((area[1:] + area[:-1]) / 2 * np.diff(h_fine))))
+
+    # inverse table on a uniform volume grid, so that the lookup index can be
+    # computed directly instead of searched
+    v_grid = np.linspace(0., vol_fine[-1], n_table)
+    h_of_v = np.interp(v_grid, vol_fine, h_fine) - h_points[0]
+
+    h_grid = np.linspace(h_points[0], h_points[-1], n_table)
+    v_of_h = np.interp(h_grid, h_fine, vol_fine)
+
+    for table in (v_grid, h_of_v, h_grid, v_of_h):
+        table.setflags(write=False)
+
+    return v_grid, h_of_v, h_grid - h_points[0], v_of_h
+
+
+class BottleProfile:
+
+    """
+        Axisymmetric bottle described by its radius profile r(h) [m], with h [m]
+        measured from the nozzle (the bottle flies upside down, so the liquid
+        fills the neck first). Volume <-> height lookup tables are built once
+        per profile and shared between all the instances using it.
+    """
+
+    def __init__(self, h_points, r_points, n_table=4096):
+
+        self.h_points = tuple(float(h) for h in h_points)
+        self.r_points = tuple(float(r) for r in r_points)
+        self.n_table = int(n_table)
+
+        v_grid, h_of_v, h_grid, v_of_h = _build_tables(self.h_points, self.r_points, int(n_table))
+
+        self.__v_grid = v_grid
+        self.__h_of_v = h_of_v
+        self.__h_grid = h_grid
+        self.__v_of_h = v_of_h
+
+        # plain python copies for the scalar lookup used at every step
+        self.__h_of_v_list = h_of_v.tolist()
+        self.__d_vol = v_grid[1] - v_grid[0]
+        self.__n_last = len(v_grid) - 1
+
+        self.total_volume = float(v_grid[-1])
+        self.height = float(h_grid[-1])
+        self.r_max = max(self.r_points)
+
+    def volume_to_height(self, vol):
+
+        if isinstance(vol, (float, int)):
+
+            x = vol / self.__d_vol
+
+            if x <= 0:
+                return 0.
+
+            i = int(x)
+
+            if i >= self.__n_last:
+                return self.height
+
+            h_list = self.__h_of_v_list
+            return h_list[i] + (x - i) * (h_list[i + 1] - h_list[i])
+
+        return np.interp(vol, self.__v_grid, self.__h_of_v)
+
+    def height_to_volume(self, h):
+
+        return np.interp(h, self.__h_grid, self.__v_of_h)
+
+    def scaled(self, h_factor=1., r_factor=1.):
+
+        return BottleProfile(
+
+            [h * h_factor for h in self.h_points],
+            [r * r_factor for r in self.r_points],
+            n_table=self.n_table
+
+        )
+
+    def with_r_max(self, r_max):
+
+        # the neck radius (the one at the nozzle) is kept, the other radii are
+        # moved linearly between the neck and the new maximum radius
+        r_neck = self.r_points[0]
+
+        if self.r_max == r_neck:
+            return self.scaled(r_factor=r_max / self.r_max)
+
+        if not r_max > r_neck:
+            raise ValueError("the maximum radius must be larger than the neck radius ({} m)".format(r_neck))
+
+        factor = (r_max - r_neck) / (self.r_max - r_neck)
+
+        return BottleProfile(
+
+            self.h_points,
+            [r_neck + (r - r_neck) * factor for r in self.r_points],
+            n_table=self.n_table
+
+        )
+
+
+def pet_bottle_profile(
+
+        d_max=0.08, d_neck=0.025, neck_length=0.02,
+        shoulder_length=0.06, body_length=0.27, n_table=4096
+
+):
+
+    r_max = d_max / 2
+    r_neck = d_neck / 2
+
+    h_points = [
+
+        0.,
+        neck_length,
+        neck_length + shoulder_length,
+        neck_length + shoulder_length + body_length
+
+    ]
+    r_points = [r_neck, r_neck, r_max, r_max]
+
+    return BottleProfile(h_points, r_points, n_table=n_table)
+
+
+class ProfiledRocketGeometry(AbstractRocketGeometry):
+
+    """
+        d_max and V_bottle are derived from the profile. Setting them rescales the
+        profile (radially for d_max, axially for V_bottle) and rebuilds the lookup
+        tables, so that the free surface height always refers to the same bottle.
+        Setting d_max keeps the neck radius (it must match d_nozzle) and only
+        widens or narrows the shoulder and the body.
+    """
+
+    def __init__(self, profile: BottleProfile = None):
+
+        # the default d_max / V_bottle set by AbstractRocketGeometry are ignored
+        self.profile = None
+        super().__init__()
+
+        if profile is None:
+            profile = pet_bottle_profile()
+
+        self.__set_profile(profile)
+
+    def __set_profile(self, profile: BottleProfile):
+
+        self.profile = profile
+        self.A_max = np.pi * np.power(profile.r_max, 2)
+
+    @property
+    def d_max(self):
+        return 2 * self.profile.r_max
+
+    @d_max.setter
+    def d_max(self, d_max):
+
+        if self.profile is not None:
+
+            self.__set_profile(self.profile.with_r_max(d_max / 2))
+
+    @property
+    def V_bottle_m3(self):
+        return self.profile.total_volume
+
+    @V_bottle_m3.setter
+    def V_bottle_m3(self, volume):
+
+        if self.profile is not None:
+
+            self.__set_profile(self.profile.scaled(h_factor=volume / self.profile.total_volume))
+
+    def get_fingerprint(self) -> dict:
+
+        fingerprint = super().get_fingerprint()
+        fingerprint.update({
+
+            "h_points": self.profile.h_points,
+            "r_points": self.profile.r_points,
+            "n_table": self.profile.n_table
+
+        })
+
+        return fingerprint
+
+    def get_free_surface_h(self, fill_perc):
+
+        return self.profile.volume_to_height(self.V_bottle_m3 * fill_perc)
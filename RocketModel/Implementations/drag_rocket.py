@@ -0,0 +1,36 @@
+from RocketModel.Implementations.ideal_rocket import IdealRocket
+from RocketModel.Aerodynamics.drag import DragModel
+import copy
+
+
+class DragRocket(IdealRocket):
+
+    def __init__(self, P_0, T_0, fill_start, geometry=None, drag_model=None, **kwargs):
+
+        super().__init__(P_0, T_0, fill_start, geometry=geometry, **kwargs)
+
+        if drag_model is None:
+            drag_model = DragModel(self.geom)
+
+        self.drag_model = drag_model
+
+    def fork(self):
+
+        new_rocket = super().fork()
+
+        new_rocket.drag_model = copy.copy(self.drag_model)
+        new_rocket.drag_model.geom = new_rocket.geom
+
+        return new_rocket
+
+    def calculate_external_forces(self):
+
+        return self.drag_model.force(self.altitude, self.velocity)
+
+
+if __name__ == "__main__":
+
+    dr = DragRocket(P_0=1, T_0=25, fill_start=0.3)
+    dr.calculate()
+    dr.print_over_time()
+    dr.print_over_time(dynamic_element="v")
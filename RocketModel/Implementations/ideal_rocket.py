@@ -6,15 +6,25 @@ class IdealRocketGeometry(AbstractRocketGeometry):
 
     def get_free_surface_h(self, fill_perc):
 
-        return self.V_bottle / self.A_max * fill_perc
+        return self.V_bottle_m3 / self.A_max * fill_perc
 
 
 class IdealRocket(AbstractRocketStatus):
 
-    def __init__(self, P_0, T_0, fill_start):
+    def __init__(
 
-        geometry = IdealRocketGeometry()
-        super().__init__(geometry, P_0, T_0, fill_start)
+            self, P_0, T_0, fill_start, geometry=None, strict=False,
+            dt_thrust=0.000001, dt_coast=0.01
+
+    ):
+
+        if geometry is None:
+            geometry = IdealRocketGeometry()
+
+        self.dt_thrust = dt_thrust
+        self.dt_coast = dt_coast
+
+        super().__init__(geometry, P_0, T_0, fill_start, strict=strict)
 
     def calculate_external_forces(self):
         return 0.
@@ -23,15 +33,15 @@ class IdealRocket(AbstractRocketStatus):
 
         if not self.out_of_liquid:
 
-            return 0.000001
+            return self.dt_thrust
 
         if not self.out_of_gas:
 
-            return 0.000001
+            return self.dt_thrust
 
         else:
 
-            return 0.01
+            return self.dt_coast
 
     def evaluate_pressure_losses_beta(self):
 
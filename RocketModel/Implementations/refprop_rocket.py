@@ -0,0 +1,21 @@
+from FluidProperties.REFPROP_properties import WaterProperties, AirProperties
+from RocketModel.Implementations.ideal_rocket import IdealRocket
+
+
+class RefpropRocket(IdealRocket):
+
+    @property
+    def liquid_properties_class(self):
+        return WaterProperties
+
+    @property
+    def gas_properties_class(self):
+        return AirProperties
+
+
+if __name__ == "__main__":
+
+    rr = RefpropRocket(P_0=1, T_0=25, fill_start=0.3)
+    rr.calculate()
+    rr.print_over_time()
+    rr.print_over_time("pressure")
@@ -1,14 +1,14 @@
 from FluidProperties.ideal_properties import AirPropertiesIdeal, WaterPropertiesIdeal
 from RocketModel.abstract_classes import AbstractRocketStatus, AbstractRocketGeometry
-import matplotlib.pyplot as plt
-import scipy.optimize as opt
 import numpy as np
 
 
 class RocketGeometryTrial(AbstractRocketGeometry):
 
     def get_free_surface_h(self, fill_perc):
-        pass
+
+        # needed by the initial flow rate evaluation, no longer hidden by a bare except
+        return self.V_bottle_m3 / self.A_max * fill_perc
 
 
 class RocketStatusTrial(AbstractRocketStatus):
@@ -44,6 +44,8 @@ def calculate_w_exp(P_value, T_value, fill_value):
 
 def calculate_opt_fill(P_value, T_value, best_fill=0.3):
 
+    import scipy.optimize as opt
+
     return float(opt.minimize(
 
         lambda fill_value: -calculate_w_exp(P_value, T_value, float(fill_value)),
@@ -57,6 +59,9 @@ def calculate_opt_fill(P_value, T_value, best_fill=0.3):
 # noinspection PyUnresolvedReferences
 def print_fill_list(max_P, min_P, n_points=10):
 
+    from Visualization.plot_functions import get_pyplot
+    plt = get_pyplot()
+
     T_in = 25
     P_in_list = np.logspace(0.0, 2.0, num=n_points) / 100 * (max_P - min_P) + min_P
     fill_list = np.array(range(0, 100)) / 100
@@ -104,6 +109,9 @@ def print_fill_list(max_P, min_P, n_points=10):
 # noinspection PyUnresolvedReferences
 def print_w_exp_and_fill(max_P, min_P, n_points=100):
 
+    from Visualization.plot_functions import get_pyplot
+    plt = get_pyplot()
+
     T_in = 25
     P_in_list = np.logspace(0.0, 2.0, num=n_points) / 100 * (max_P - min_P) + min_P
 
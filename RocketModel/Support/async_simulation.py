@@ -0,0 +1,106 @@
+import asyncio
+
+
+class FlightMonitor:
+
+    """
+        Advances a rocket by chunks of steps and detects the flight phase events:
+        "liquid_depleted", "burnout" (no more gas thrust), "apogee" and "landing".
+        Every chunk ends with a "progress" snapshot.
+    """
+
+    def __init__(self, rocket):
+
+        self.rocket = rocket
+        self.n_steps = 0
+
+        self.__liquid_depleted = rocket.out_of_liquid
+        self.__burnout = rocket.out_of_gas
+        self.__apogee = False
+
+    @property
+    def finished(self):
+
+        return self.rocket.has_landed
+
+    def advance(self, n_steps):
+
+        rocket = self.rocket
+        events = list()
+
+        for i in range(n_steps):
+
+            if rocket.has_landed:
+                break
+
+            v_old = rocket.velocity
+            rocket.step(rocket.get_dt())
+            self.n_steps += 1
+
+            if not self.__liquid_depleted and rocket.out_of_liquid:
+
+                self.__liquid_depleted = True
+                events.append(self.snapshot("liquid_depleted"))
+
+            if not self.__burnout and rocket.out_of_gas:
+
+                self.__burnout = True
+                events.append(self.snapshot("burnout"))
+
+            if not self.__apogee and v_old > 0 >= rocket.velocity:
+
+                self.__apogee = True
+                events.append(self.snapshot("apogee"))
+
+        if rocket.has_landed:
+
+            events.append(self.snapshot("landing"))
+
+        else:
+
+            events.append(self.snapshot("progress"))
+
+        return events
+
+    def snapshot(self, event_type):
+
+        return {
+
+            "type": event_type,
+            "step": self.n_steps,
+            "time": self.rocket.time,
+            "z": self.rocket.altitude,
+            "v": self.rocket.velocity
+
+        }
+
+
+async def stream_flight(rocket, steps_per_chunk=10000, executor=None):
+
+    """
+        Async generator yielding the events of FlightMonitor while the integration
+        runs, by chunks, on "executor" (the default thread pool of the loop if
+        None). The event loop is free between chunks and no thread is held by a
+        flight while it is waiting: cancelling the consumer (or closing the
+        generator) stops the flight after the chunk being computed.
+    """
+
+    loop = asyncio.get_running_loop()
+    monitor = FlightMonitor(rocket)
+
+    while not monitor.finished:
+
+        events = await loop.run_in_executor(executor, monitor.advance, steps_per_chunk)
+
+        for event in events:
+            yield event
+
+
+async def simulate_async(rocket, on_event=None, steps_per_chunk=10000, executor=None):
+
+    async for event in stream_flight(rocket, steps_per_chunk=steps_per_chunk, executor=executor):
+
+        if on_event is not None:
+            on_event(event)
+
+    return rocket
@@ -0,0 +1,40 @@
+import pickle
+import os
+
+
+def save_checkpoint(obj, path):
+
+    # the state is written on a temporary file and then moved, so that a run
+    # killed while writing never leaves a corrupted checkpoint behind
+    tmp_path = "{}.tmp".format(path)
+    checkpoint = {"fingerprint": obj.fingerprint, "state": obj.get_state()}
+
+    with open(tmp_path, "wb") as file:
+        pickle.dump(checkpoint, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(obj, path):
+
+    with open(path, "rb") as file:
+        checkpoint = pickle.load(file)
+
+    # a checkpoint written by another configuration would silently replace
+    # the run with a different one
+    if not isinstance(checkpoint, dict) or checkpoint.get("fingerprint") != obj.fingerprint:
+        raise ValueError("checkpoint {} was not written by this rocket configuration".format(path))
+
+    obj.set_state(checkpoint["state"])
+    return obj
+
+
+def has_checkpoint(path):
+
+    return path is not None and os.path.isfile(path)
+
+
+def remove_checkpoint(path):
+
+    if has_checkpoint(path):
+        os.remove(path)
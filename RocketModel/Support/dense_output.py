@@ -0,0 +1,119 @@
+import numpy as np
+
+
+class DenseTrajectory:
+
+    """
+        Continuous extension of a recorded trajectory. Between two samples the
+        integrator keeps the acceleration of the step constant, so position and
+        velocity are evaluated with the same polynomials used by the step:
+
+            v(t) = v_i + a_(i+1) tau
+            z(t) = z_i + v_i tau + 1/2 a_(i+1) tau^2        tau = t - t_i
+
+        and are therefore exact with respect to the integration, whatever dt is.
+        The other recorded quantities are interpolated linearly.
+    """
+
+    def __init__(self, trajectory):
+
+        self.trajectory = trajectory
+
+        self.t = trajectory["time"]
+        self.z = trajectory["z"]
+        self.v = trajectory["v"]
+        self.a = trajectory["a"]
+
+        if len(self.t) < 2:
+            raise ValueError("at least two samples are needed for the dense output")
+
+    def __interval(self, t):
+
+        i = np.searchsorted(self.t, t, side="right") - 1
+        return np.clip(i, 0, len(self.t) - 2)
+
+    def state_at_time(self, t) -> dict:
+
+        t = np.clip(np.asarray(t, dtype=float), self.t[0], self.t[-1])
+        i = self.__interval(t)
+
+        tau = t - self.t[i]
+        a = self.a[i + 1]
+
+        state = {
+
+            "time": t,
+            "a": a,
+            "v": self.v[i] + a * tau,
+            "z": self.z[i] + self.v[i] * tau + 0.5 * a * np.power(tau, 2)
+
+        }
+
+        for column in self.trajectory.columns:
+
+            if column not in state:
+
+                values = self.trajectory[column]
+                state[column] = np.interp(t, self.t, values)
+
+        return state
+
+    def times_at_altitude(self, z):
+
+        """
+            All the times (ascending order) at which the rocket crosses altitude z.
+        """
+
+        z_i = self.z[:-1] - z
+        v_i = self.v[:-1]
+        a = self.a[1:]
+        h = np.diff(self.t)
+
+        # coefficients of 1/2 a tau^2 + v_i tau + z_i = 0 on each interval
+        with np.errstate(divide="ignore", invalid="ignore"):
+
+            disc = np.power(v_i, 2) - 2 * a * z_i
+            sqrt_disc = np.sqrt(np.maximum(disc, 0.))
+
+            roots = np.stack((
+
+                (- v_i - sqrt_disc) / a,
+                (- v_i + sqrt_disc) / a,
+                - z_i / v_i
+
+            ))
+
+        linear = np.abs(a) < 1e-12
+        quadratic = ~linear & (disc >= 0)
+
+        valid = np.stack((quadratic, quadratic, linear))
+        valid &= np.isfinite(roots) & (roots >= 0) & (roots < h)
+
+        times = (self.t[:-1] + roots)[valid]
+
+        # the last sample is exactly on z if the crossing ends the trajectory
+        if self.z[-1] == z:
+            times = np.append(times, self.t[-1])
+
+        return np.unique(times)
+
+    def state_at_altitude(self, z, branch="ascent") -> dict:
+
+        times = self.times_at_altitude(z)
+
+        if len(times) == 0:
+            raise ValueError("altitude {} [m] is never reached".format(z))
+
+        if branch == "ascent":
+
+            t = times[0]
+
+        elif branch == "descent":
+
+            t = times[-1]
+
+        else:
+
+            raise ValueError("branch must be \"ascent\" or \"descent\"")
+
+        return self.state_at_time(t)
@@ -0,0 +1,281 @@
+"""
+    Job file example (TOML, the same structure can be written in JSON or YAML):
+
+        name = "pressure_fill_study"
+        output_dir = "results/pressure_fill_study"
+        n_workers = 4
+
+        [base]                      # sweep configuration, see build_rocket
+        rocket = "drag"
+        P_0 = 0.5
+        T_0 = 25
+        fill_start = 0.3
+
+        [base.geometry]
+        Cd = 0.5
+
+        [base.integrator]
+        dt_thrust = 1e-5
+        dt_coast = 0.01
+
+        [[variants]]                # optional, merged on base (e.g. geometries)
+        rocket = "drag_pet"
+
+        [grid]                      # cartesian product, dotted keys for nested values
+        P_0 = [0.3, 0.5, 0.7]
+        fill_start = {start = 0.1, stop = 0.6, num = 6}
+        "geometry.Cd" = {start = 0.3, stop = 0.9, num = 4, log = true}
+
+        [recording]
+        trajectories = "none"       # "none", "full" (one .npz per point) or "resampled"
+        n_samples = 1024            # "resampled" only
+        columns = ["time", "z", "v"]
+"""
+
+from RocketModel.Support.shared_results import run_shared_sweep, SUMMARY_FIELDS, TRAJECTORY_COLUMNS
+from RocketModel.Support.sweep import Sweep, point_key
+import numpy as np
+import itertools
+import hashlib
+import copy
+import json
+import csv
+import os
+
+
+def load_job(path):
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".json":
+
+        with open(path, "r") as file:
+            return json.load(file)
+
+    elif extension == ".toml":
+
+        try:
+
+            import tomllib
+
+        except ImportError:
+
+            # Python < 3.11
+            try:
+
+                import tomli as tomllib
+
+            except ImportError:
+
+                raise ImportError("tomli is needed to read TOML job files before Python 3.11, use JSON otherwise")
+
+        with open(path, "rb") as file:
+            return tomllib.load(file)
+
+    elif extension in (".yaml", ".yml"):
+
+        try:
+
+            import yaml
+
+        except ImportError:
+
+            raise ImportError("PyYAML is needed to read YAML job files, use TOML or JSON otherwise")
+
+        with open(path, "r") as file:
+            return yaml.safe_load(file)
+
+    raise ValueError("unsupported job file format: {}".format(extension))
+
+
+def grid_values(values):
+
+    if isinstance(values, dict):
+
+        if values.get("log", False):
+
+            return np.geomspace(values["start"], values["stop"], int(values["num"])).tolist()
+
+        return np.linspace(values["start"], values["stop"], int(values["num"])).tolist()
+
+    if isinstance(values, list):
+
+        return values
+
+    return [values]
+
+
+def set_dotted(config: dict, key: str, value):
+
+    *parents, name = key.split(".")
+
+    for parent in parents:
+        config = config.setdefault(parent, dict())
+
+    config[name] = value
+
+
+def merge(base: dict, update: dict):
+
+    merged = copy.deepcopy(base)
+
+    for key, value in update.items():
+
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+
+            merged[key] = merge(merged[key], value)
+
+        else:
+
+            merged[key] = copy.deepcopy(value)
+
+    return merged
+
+
+def expand_job(job: dict):
+
+    """
+        Returns the list of (grid point, sweep configuration) of the job, grid
+        point being the dict of the grid values of that configuration.
+    """
+
+    base = job.get("base", dict())
+    variants = job.get("variants", [dict()])
+    grid = job.get("grid", dict())
+
+    keys = list(grid.keys())
+    axes = [grid_values(grid[key]) for key in keys]
+
+    points = list()
+
+    for i, variant in enumerate(variants):
+
+        variant_config = merge(base, variant)
+
+        for values in itertools.product(*axes):
+
+            config = copy.deepcopy(variant_config)
+
+            for key, value in zip(keys, values):
+                set_dotted(config, key, value)
+
+            point = {"variant": i}
+            point.update(zip(keys, values))
+            points.append((point, config))
+
+    return points
+
+
+def write_table(path, rows):
+
+    columns = list()
+
+    for row in rows:
+
+        for column in row.keys():
+
+            if column not in columns:
+                columns.append(column)
+
+    with open(path, "w", newline="") as file:
+
+        writer = csv.DictWriter(file, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    np.savez(path.replace(".csv", ".npz"), **{
+
+        column: np.array([row.get(column, np.nan) for row in rows])
+        for column in columns if all(isinstance(row.get(column), (int, float)) for row in rows)
+
+    })
+
+
+def run_job(job: dict, output_dir=None, n_workers=None):
+
+    """
+        Runs a job and writes in output_dir:
+
+            points.csv / points.npz     one row per configuration (grid values, summary)
+            configs.json                the expanded configurations
+            trajectories/               "full" recording, one .npz per point key
+            trajectories.npz            "resampled" recording, arrays (n_points, n_samples)
+            results_<hash>.dat          "resampled" recording buffer, one per job layout
+
+        Completed points are kept in output_dir/checkpoints, so a job that is
+        run again only computes the missing ones.
+    """
+
+    if output_dir is None:
+        output_dir = job.get("output_dir", job.get("name", "job_output"))
+
+    if n_workers is None:
+        n_workers = job.get("n_workers", 1)
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    recording = job.get("recording", dict())
+    mode = recording.get("trajectories", "none")
+
+    points = expand_job(job)
+    configs = [config for point, config in points]
+
+    with open(os.path.join(output_dir, "configs.json"), "w") as file:
+        json.dump(configs, file, indent=1)
+
+    if mode == "resampled":
+
+        columns = tuple(recording.get("columns", TRAJECTORY_COLUMNS))
+        n_samples = recording.get("n_samples", 1024)
+
+        # the buffer file is keyed on everything that defines its content, so a
+        # job with a different grid or recording never reopens an old one
+        layout_key = hashlib.sha1(json.dumps(
+
+            {"configs": configs, "n_samples": n_samples, "columns": columns},
+            sort_keys=True
+
+        ).encode()).hexdigest()[:16]
+
+        results = run_shared_sweep(
+
+            configs, n_samples=n_samples, columns=columns,
+            path=os.path.join(output_dir, "results_{}.dat".format(layout_key)),
+            n_workers=n_workers
+
+        )
+
+        summaries = [dict(zip(SUMMARY_FIELDS, row.tolist())) for row in results.summaries]
+        np.savez(
+
+            os.path.join(output_dir, "trajectories.npz"),
+            **{column: results.trajectories[:, j, :] for j, column in enumerate(columns)}
+
+        )
+        results.close()
+
+    elif mode in ("none", "full"):
+
+        sweep = Sweep(
+
+            configs, checkpoint_dir=os.path.join(output_dir, "checkpoints"),
+            trajectory_dir=os.path.join(output_dir, "trajectories") if mode == "full" else None
+
+        )
+        summaries = sweep.run(n_workers=n_workers)
+
+    else:
+
+        raise ValueError("unknown trajectory recording: {}".format(mode))
+
+    rows = list()
+
+    for (point, config), summary in zip(points, summaries):
+
+        row = {"key": point_key(config)}
+        row.update(point)
+        row.update(summary)
+        rows.append(row)
+
+    write_table(os.path.join(output_dir, "points.csv"), rows)
+    return rows
@@ -0,0 +1,39 @@
+def burnout(rocket):
+
+    return rocket.out_of_gas
+
+
+def run_variants(rocket, variants, shared_until=burnout):
+
+    """
+        Integrates "rocket" until shared_until(rocket) is True (by default until
+        the end of the thrust phase) and then continues a fork of it for each
+        variant. A variant is either a dict of geometry parameters to change
+        (e.g. {"Cd": 0.4}) or a function modifying the forked rocket in place.
+        Returns the list of the completed forks.
+    """
+
+    rocket.calculate_until(shared_until)
+    branches = list()
+
+    for variant in variants:
+
+        branch = rocket.fork()
+
+        if isinstance(variant, dict):
+
+            for key, value in variant.items():
+
+                if not hasattr(branch.geom, key):
+                    raise AttributeError("unknown geometry parameter: {}".format(key))
+
+                setattr(branch.geom, key, value)
+
+        else:
+
+            variant(branch)
+
+        branch.calculate()
+        branches.append(branch)
+
+    return branches
@@ -0,0 +1,289 @@
+from RocketModel.Support.sweep import build_rocket, summarize
+import numpy as np
+import json
+import time
+import os
+
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+GOLDEN_COLUMNS = ("z", "v", "a", "pressure", "m_dot", "level")
+GOLDEN_SAMPLES = 512
+
+# relative tolerances: "summary" / "trajectory" are the defaults, any summary
+# field or trajectory column can be given its own value
+DEFAULT_TOLERANCES = {
+
+    "summary": 1e-3,
+    "trajectory": 1e-2
+
+}
+
+REFERENCE_CONFIGS = {
+
+    "ideal_default": {"rocket": "ideal", "P_0": 1, "T_0": 25, "fill_start": 0.3},
+    "ideal_high_pressure": {"rocket": "ideal", "P_0": 3, "T_0": 25, "fill_start": 0.4},
+    "ideal_small_nozzle": {
+
+        "rocket": "ideal", "P_0": 1, "T_0": 25, "fill_start": 0.3,
+        "geometry": {"d_nozzle": 0.01}
+
+    },
+    "ideal_pet": {"rocket": "ideal_pet", "P_0": 1, "T_0": 25, "fill_start": 0.3},
+    "drag_default": {"rocket": "drag", "P_0": 1, "T_0": 25, "fill_start": 0.3},
+    "refprop_default": {"rocket": "refprop", "P_0": 1, "T_0": 25, "fill_start": 0.3}
+
+}
+
+
+def reference_engine(config: dict):
+
+    rocket = build_rocket(config)
+    rocket.calculate()
+    return rocket
+
+
+# an engine is a function config -> calculated rocket, faster engines (other
+# integrators, tabulated properties...) are registered here to be checked
+ENGINES = {
+
+    "reference": reference_engine
+
+}
+
+
+def register_engine(name, engine):
+
+    ENGINES[name] = engine
+
+
+def run_engine(engine, config):
+
+    start = time.perf_counter()
+    rocket = engine(config)
+    return rocket, time.perf_counter() - start
+
+
+def resample(trajectory, t_grid, columns=GOLDEN_COLUMNS):
+
+    t = trajectory["time"]
+    return {column: np.interp(t_grid, t, trajectory[column]) for column in columns}
+
+
+def golden_path(name, golden_dir=GOLDEN_DIR):
+
+    return os.path.join(golden_dir, "{}.npz".format(name))
+
+
+def record_golden(names=None, golden_dir=GOLDEN_DIR, engine="reference"):
+
+    if names is None:
+        names = list(REFERENCE_CONFIGS.keys())
+
+    os.makedirs(golden_dir, exist_ok=True)
+    recorded = list()
+
+    for name in names:
+
+        config = REFERENCE_CONFIGS[name]
+
+        try:
+
+            rocket, runtime = run_engine(ENGINES[engine], config)
+
+        except ImportError:
+
+            # e.g. REFPROP not available on this machine
+            continue
+
+        summary = summarize(rocket)
+        t_grid = np.linspace(0., summary["t_flight"], GOLDEN_SAMPLES)
+
+        data = {"summary_{}".format(key): value for key, value in summary.items()}
+        data.update({
+
+            "trajectory_{}".format(column): values
+            for column, values in resample(rocket.trajectory, t_grid).items()
+
+        })
+
+        np.savez_compressed(
+
+            golden_path(name, golden_dir),
+            config=json.dumps(config, sort_keys=True),
+            runtime=runtime, **data
+
+        )
+
+        recorded.append(name)
+
+    return recorded
+
+
+def load_golden(name, golden_dir=GOLDEN_DIR):
+
+    with np.load(golden_path(name, golden_dir)) as data:
+
+        golden = {
+
+            "config": json.loads(str(data["config"])),
+            "runtime": float(data["runtime"]),
+            "summary": dict(),
+            "trajectory": dict()
+
+        }
+
+        for key in data.files:
+
+            if key.startswith("summary_"):
+
+                golden["summary"][key[len("summary_"):]] = float(data[key])
+
+            elif key.startswith("trajectory_"):
+
+                golden["trajectory"][key[len("trajectory_"):]] = data[key]
+
+    return golden
+
+
+def relative_delta(new, golden):
+
+    scale = np.max(np.abs(golden))
+    return float(np.max(np.abs(np.asarray(new) - golden)) / max(scale, np.finfo(float).tiny))
+
+
+def check_engine(engine="reference", names=None, golden_dir=GOLDEN_DIR, tolerances=None, baseline="reference"):
+
+    """
+        Runs "engine" on the reference configurations and compares it with the
+        golden files. Each entry of the returned report has the relative deltas
+        of the summary fields and of the (resampled) trajectory columns, the
+        pass / fail status and the speedup with respect to the "baseline" engine
+        timed on the same machine.
+    """
+
+    tol = dict(DEFAULT_TOLERANCES)
+    tol.update(tolerances or dict())
+
+    if names is None:
+        names = list(REFERENCE_CONFIGS.keys())
+
+    report = list()
+
+    for name in names:
+
+        entry = {"config": name}
+        report.append(entry)
+
+        if not os.path.isfile(golden_path(name, golden_dir)):
+
+            entry["status"] = "missing"
+            continue
+
+        golden = load_golden(name, golden_dir)
+
+        try:
+
+            rocket, runtime = run_engine(ENGINES[engine], golden["config"])
+
+            if baseline is not None and not baseline == engine:
+
+                baseline_runtime = run_engine(ENGINES[baseline], golden["config"])[1]
+
+            else:
+
+                baseline_runtime = runtime
+
+        except ImportError:
+
+            entry["status"] = "skipped"
+            continue
+
+        summary = summarize(rocket)
+        t_grid = np.linspace(0., golden["summary"]["t_flight"], GOLDEN_SAMPLES)
+        trajectory = resample(rocket.trajectory, t_grid, golden["trajectory"].keys())
+
+        entry["summary_delta"] = {
+
+            key: relative_delta(summary[key], value)
+            for key, value in golden["summary"].items()
+
+        }
+        entry["trajectory_delta"] = {
+
+            column: relative_delta(trajectory[column], values)
+            for column, values in golden["trajectory"].items()
+
+        }
+
+        passed = all(
+
+            delta <= tol.get(key, tol["summary"])
+            for key, delta in entry["summary_delta"].items()
+
+        ) and all(
+
+            delta <= tol.get(column, tol["trajectory"])
+            for column, delta in entry["trajectory_delta"].items()
+
+        )
+
+        entry["status"] = "pass" if passed else "fail"
+        entry["runtime"] = runtime
+        entry["speedup"] = baseline_runtime / runtime
+
+    return report
+
+
+def print_report(report):
+
+    for entry in report:
+
+        if entry["status"] in ("missing", "skipped"):
+
+            print("{:<24}{}".format(entry["config"], entry["status"]))
+            continue
+
+        worst_summary = max(entry["summary_delta"].items(), key=lambda item: item[1])
+        worst_trajectory = max(entry["trajectory_delta"].items(), key=lambda item: item[1])
+
+        print("{:<24}{:<6} summary {}={:.2e}  trajectory {}={:.2e}  runtime {:.3f} s  speedup x{:.2f}".format(
+
+            entry["config"], entry["status"],
+            worst_summary[0], worst_summary[1],
+            worst_trajectory[0], worst_trajectory[1],
+            entry["runtime"], entry["speedup"]
+
+        ))
+
+
+if __name__ == "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="golden trajectory regression harness")
+    parser.add_argument("action", choices=["record", "check"])
+    parser.add_argument("--engine", default="reference")
+    parser.add_argument("--baseline", default="reference")
+    parser.add_argument("--configs", nargs="*", default=None)
+    parser.add_argument("--golden-dir", default=GOLDEN_DIR)
+    parser.add_argument("--summary-tol", type=float, default=DEFAULT_TOLERANCES["summary"])
+    parser.add_argument("--trajectory-tol", type=float, default=DEFAULT_TOLERANCES["trajectory"])
+    args = parser.parse_args()
+
+    if args.action == "record":
+
+        print("recorded: {}".format(record_golden(args.configs, args.golden_dir, args.engine)))
+
+    else:
+
+        results = check_engine(
+
+            args.engine, args.configs, args.golden_dir,
+            tolerances={"summary": args.summary_tol, "trajectory": args.trajectory_tol},
+            baseline=args.baseline
+
+        )
+        print_report(results)
+
+        if any(entry["status"] == "fail" for entry in results):
+            raise SystemExit(1)
@@ -0,0 +1,262 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from RocketModel.Support.sweep import build_rocket, summarize, point_key
+import numpy as np
+import json
+import os
+
+
+SUMMARY_FIELDS = ("z_max", "v_max", "a_max", "t_flight", "w_exp", "eta_exp", "max_z_theory")
+TRAJECTORY_COLUMNS = ("time", "z", "v", "a", "pressure", "m_dot", "level")
+
+
+class SharedSweepResults:
+
+    """
+        Result arrays of a sweep, allocated by the parent process in shared memory
+        (or in a memory-mapped file if "path" is given) and written in place by
+        the workers, so that nothing but the point index travels back through the
+        process pool.
+
+        Each trajectory is resampled on n_samples uniform time steps between
+        launch and landing. Layout of the buffer (float64):
+
+            done            (n_points,)
+            summaries       (n_points, len(SUMMARY_FIELDS))
+            trajectories    (n_points, len(columns), n_samples)
+
+        With a memory-mapped file the layout and the point_key of each slot are
+        stored in "<path>.json". The process that owns the results (the one
+        passing "keys") reopens an existing file only if the layout is the same.
+        It then keeps as done only the slots whose stored key matches.
+    """
+
+    def __init__(
+
+            self, n_points, n_samples=1024, columns=TRAJECTORY_COLUMNS,
+            path=None, shm_name=None, keys=None
+
+    ):
+
+        self.n_points = int(n_points)
+        self.n_samples = int(n_samples)
+        self.columns = tuple(columns)
+        self.path = path
+        self.keys = None if keys is None else list(keys)
+
+        if self.keys is not None and not len(self.keys) == self.n_points:
+            raise ValueError("one key per point is needed")
+
+        n_fields = len(SUMMARY_FIELDS)
+        size = self.n_points * (1 + n_fields + len(self.columns) * self.n_samples)
+
+        self.__shm = None
+        stored_keys = None
+
+        if path is not None:
+
+            reopened = os.path.isfile(path)
+
+            if reopened and self.keys is not None:
+                stored_keys = self.__check_layout()
+
+            mode = "r+" if reopened else "w+"
+            buffer = np.memmap(path, dtype=np.float64, mode=mode, shape=(size,))
+
+        else:
+
+            if shm_name is None:
+
+                self.__shm = shared_memory.SharedMemory(create=True, size=size * 8)
+                self.__owner = True
+
+            else:
+
+                self.__shm = shared_memory.SharedMemory(name=shm_name)
+                self.__owner = False
+
+            buffer = np.ndarray((size,), dtype=np.float64, buffer=self.__shm.buf)
+
+            if self.__owner:
+                buffer[:] = 0.
+
+        self.__buffer = buffer
+
+        i_0 = self.n_points
+        i_1 = i_0 + self.n_points * n_fields
+
+        self.done = buffer[:i_0]
+        self.summaries = buffer[i_0:i_1].reshape((self.n_points, n_fields))
+        self.trajectories = buffer[i_1:].reshape((self.n_points, len(self.columns), self.n_samples))
+
+        if path is not None and self.keys is not None:
+
+            if stored_keys is not None:
+
+                # slots written for a different configuration must be recomputed
+                for i, (key, stored_key) in enumerate(zip(self.keys, stored_keys)):
+
+                    if not key == stored_key:
+                        self.done[i] = 0.
+
+            self.__write_layout()
+
+    @property
+    def layout(self) -> dict:
+
+        return {
+
+            "n_points": self.n_points,
+            "n_samples": self.n_samples,
+            "columns": list(self.columns),
+            "summary_fields": list(SUMMARY_FIELDS)
+
+        }
+
+    @property
+    def layout_path(self):
+
+        return "{}.json".format(self.path)
+
+    def __check_layout(self):
+
+        if not os.path.isfile(self.layout_path):
+            raise ValueError("{} has no layout file, it cannot be reopened safely".format(self.path))
+
+        with open(self.layout_path, "r") as file:
+            stored = json.load(file)
+
+        stored_layout = {key: stored[key] for key in self.layout.keys() if key in stored}
+
+        if not stored_layout == self.layout:
+
+            raise ValueError("{} was written with a different layout: {} (expected {})".format(
+
+                self.path, stored_layout, self.layout
+
+            ))
+
+        return stored["keys"]
+
+    def __write_layout(self):
+
+        layout = self.layout
+        layout["keys"] = self.keys
+
+        tmp_path = "{}.tmp".format(self.layout_path)
+
+        with open(tmp_path, "w") as file:
+            json.dump(layout, file)
+
+        os.replace(tmp_path, self.layout_path)
+
+    @property
+    def descriptor(self) -> dict:
+
+        return {
+
+            "n_points": self.n_points,
+            "n_samples": self.n_samples,
+            "columns": self.columns,
+            "path": self.path,
+            "shm_name": None if self.__shm is None else self.__shm.name
+
+        }
+
+    @classmethod
+    def attach(cls, descriptor: dict):
+
+        return cls(**descriptor)
+
+    def write(self, i, rocket):
+
+        summary = summarize(rocket)
+        self.summaries[i, :] = [summary[field] for field in SUMMARY_FIELDS]
+
+        trajectory = rocket.trajectory
+        t = trajectory["time"]
+        t_grid = np.linspace(t[0], t[-1], self.n_samples)
+
+        for j, column in enumerate(self.columns):
+
+            self.trajectories[i, j, :] = np.interp(t_grid, t, trajectory[column])
+
+        self.done[i] = 1.
+
+    def summary(self, field):
+
+        return self.summaries[:, SUMMARY_FIELDS.index(field)]
+
+    def trajectory(self, i, column):
+
+        return self.trajectories[i, self.columns.index(column), :]
+
+    @property
+    def pending(self):
+
+        return np.nonzero(self.done == 0.)[0].tolist()
+
+    def flush(self):
+
+        if isinstance(self.__buffer, np.memmap):
+            self.__buffer.flush()
+
+    def close(self):
+
+        self.flush()
+
+        # the views must be released before the shared memory can be closed
+        self.done = self.summaries = self.trajectories = self.__buffer = None
+
+        if self.__shm is not None:
+
+            self.__shm.close()
+
+            if self.__owner:
+                self.__shm.unlink()
+
+
+def _run_shared_point(descriptor, i, config):
+
+    results = SharedSweepResults.attach(descriptor)
+
+    try:
+
+        rocket = build_rocket(config)
+        rocket.calculate()
+        results.write(i, rocket)
+
+    finally:
+
+        results.close()
+
+    return i
+
+
+def run_shared_sweep(configs, n_samples=1024, columns=TRAJECTORY_COLUMNS, path=None, n_workers=None):
+
+    """
+        Runs the configurations (see build_rocket) on a process pool writing into a
+        SharedSweepResults. With a memory-mapped "path", the points already done by
+        a previous (interrupted) run with the same configuration are skipped. The
+        caller must close() the returned object when done with the arrays.
+    """
+
+    configs = list(configs)
+    results = SharedSweepResults(
+
+        len(configs), n_samples=n_samples, columns=columns,
+        path=path, keys=[point_key(config) for config in configs]
+
+    )
+    descriptor = results.descriptor
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+
+        futures = [executor.submit(_run_shared_point, descriptor, i, configs[i]) for i in results.pending]
+
+        for future in futures:
+            future.result()
+
+    results.flush()
+    return results
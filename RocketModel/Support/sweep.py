@@ -0,0 +1,255 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import importlib
+import hashlib
+import json
+import os
+
+
+# rocket classes are stored as import paths so that the (heavy) fluid
+# backends are only imported by the processes that actually use them
+ROCKET_CLASSES = {
+
+    "ideal": (
+
+        "RocketModel.Implementations.ideal_rocket:IdealRocket",
+        "RocketModel.Implementations.ideal_rocket:IdealRocketGeometry"
+
+    ),
+
+    "ideal_pet": (
+
+        "RocketModel.Implementations.ideal_rocket:IdealRocket",
+        "RocketModel.Geometry.bottle_profile:ProfiledRocketGeometry"
+
+    ),
+
+    "refprop": (
+
+        "RocketModel.Implementations.refprop_rocket:RefpropRocket",
+        "RocketModel.Implementations.ideal_rocket:IdealRocketGeometry"
+
+    ),
+
+    "drag": (
+
+        "RocketModel.Implementations.drag_rocket:DragRocket",
+        "RocketModel.Implementations.ideal_rocket:IdealRocketGeometry"
+
+    ),
+
+    "drag_pet": (
+
+        "RocketModel.Implementations.drag_rocket:DragRocket",
+        "RocketModel.Geometry.bottle_profile:ProfiledRocketGeometry"
+
+    )
+
+}
+
+
+def register_rocket_class(name, rocket_path, geometry_path):
+
+    ROCKET_CLASSES[name] = (rocket_path, geometry_path)
+
+
+def import_from_path(path):
+
+    module_name, class_name = path.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def build_geometry(config: dict):
+
+    rocket_path, geometry_path = ROCKET_CLASSES[config.get("rocket", "ideal")]
+    geometry = import_from_path(geometry_path)()
+
+    for key, value in config.get("geometry", dict()).items():
+
+        if not hasattr(geometry, key):
+            raise AttributeError("unknown geometry parameter: {}".format(key))
+
+        setattr(geometry, key, value)
+
+    return geometry
+
+
+def build_rocket(config: dict):
+
+    """
+        config example:
+
+            {
+
+                "rocket": "ideal",
+                "P_0": 1, "T_0": 25, "fill_start": 0.3,     (P_0 [MPa], T_0 [°C])
+                "geometry": {"Cd": 0.5, "d_nozzle": 0.025, "V_bottle": 1.5},
+                "strict": False,    (optional, raise on the first invalid state)
+                "integrator": {"dt_thrust": 1e-6, "dt_coast": 0.01}     (optional)
+
+            }
+    """
+
+    rocket_path, geometry_path = ROCKET_CLASSES[config.get("rocket", "ideal")]
+    rocket_class = import_from_path(rocket_path)
+
+    return rocket_class(
+
+        P_0=config["P_0"], T_0=config.get("T_0", 25), fill_start=config["fill_start"],
+        geometry=build_geometry(config), strict=config.get("strict", False),
+        **config.get("integrator", dict())
+
+    )
+
+
+def summarize(rocket) -> dict:
+
+    trajectory = rocket.trajectory
+
+    return {
+
+        "z_max": float(trajectory["z"].max()),
+        "v_max": float(trajectory["v"].max()),
+        "a_max": float(trajectory["a"].max()),
+        "t_flight": float(trajectory["time"][-1]),
+        "w_exp": float(rocket.w_exp),
+        "eta_exp": float(rocket.eta_exp),
+        "max_z_theory": float(rocket.max_z_theory)
+
+    }
+
+
+def run_point(config: dict, checkpoint_path=None, checkpoint_interval=100000, trajectory_path=None):
+
+    rocket = build_rocket(config)
+    rocket.calculate(checkpoint_path=checkpoint_path, checkpoint_interval=checkpoint_interval)
+
+    if trajectory_path is not None:
+        np.savez(trajectory_path, **rocket.trajectory.as_dict())
+
+    return summarize(rocket)
+
+
+def point_key(config: dict):
+
+    return hashlib.sha1(json.dumps(config, sort_keys=True).encode()).hexdigest()[:16]
+
+
+class Sweep:
+
+    """
+        Runs a list of rocket configurations (see build_rocket). If checkpoint_dir
+        is given, completed points are stored in "progress.json" and skipped when
+        the sweep is run again, while the points that were running are resumed
+        from their own rocket checkpoint.
+    """
+
+    def __init__(self, configs, checkpoint_dir=None, checkpoint_interval=100000, trajectory_dir=None):
+
+        self.configs = list(configs)
+        self.keys = [point_key(config) for config in self.configs]
+
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_interval = checkpoint_interval
+        self.trajectory_dir = trajectory_dir
+        self.results = dict()
+
+        if self.trajectory_dir is not None:
+            os.makedirs(self.trajectory_dir, exist_ok=True)
+
+        if self.checkpoint_dir is not None:
+
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+
+            if os.path.isfile(self.progress_path):
+
+                with open(self.progress_path, "r") as file:
+                    self.results = json.load(file)["results"]
+
+    def run(self, n_workers=1):
+
+        pending = self.pending
+
+        if n_workers == 1:
+
+            for key, config in pending:
+
+                self.__record(key, run_point(
+
+                    config, self.point_checkpoint_path(key),
+                    self.checkpoint_interval, self.trajectory_path(key)
+
+                ))
+
+        else:
+
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+
+                futures = {
+
+                    executor.submit(
+
+                        run_point, config,
+                        self.point_checkpoint_path(key), self.checkpoint_interval,
+                        self.trajectory_path(key)
+
+                    ): key for key, config in pending
+
+                }
+
+                for future in as_completed(futures):
+
+                    self.__record(futures[future], future.result())
+
+        return self.summaries
+
+    def __record(self, key, summary):
+
+        self.results[key] = summary
+
+        if self.checkpoint_dir is not None:
+
+            tmp_path = "{}.tmp".format(self.progress_path)
+
+            with open(tmp_path, "w") as file:
+                json.dump({"results": self.results}, file)
+
+            os.replace(tmp_path, self.progress_path)
+
+            point_path = self.point_checkpoint_path(key)
+            if os.path.isfile(point_path):
+                os.remove(point_path)
+
+    def point_checkpoint_path(self, key):
+
+        if self.checkpoint_dir is None:
+            return None
+
+        return os.path.join(self.checkpoint_dir, "{}.pkl".format(key))
+
+    def trajectory_path(self, key):
+
+        if self.trajectory_dir is None:
+            return None
+
+        return os.path.join(self.trajectory_dir, "{}.npz".format(key))
+
+    @property
+    def progress_path(self):
+
+        return os.path.join(self.checkpoint_dir, "progress.json")
+
+    @property
+    def pending(self):
+
+        return [
+
+            (key, config) for key, config in zip(self.keys, self.configs)
+            if key not in self.results
+
+        ]
+
+    @property
+    def summaries(self):
+
+        return [self.results.get(key, None) for key in self.keys]
@@ -0,0 +1,76 @@
+import numpy as np
+
+
+class TrajectoryRecorder:
+
+    def __init__(self, columns, initial_size=1024):
+
+        self.columns = list(columns)
+
+        self.__index = {name: i for i, name in enumerate(self.columns)}
+        self.__data = np.empty((len(self.columns), max(int(initial_size), 1)))
+        self.__n = 0
+
+    def append(self, values):
+
+        if self.__n == self.__data.shape[1]:
+
+            self.__grow()
+
+        self.__data[:, self.__n] = values
+        self.__n += 1
+
+    def __grow(self):
+
+        new_data = np.empty((self.__data.shape[0], 2 * self.__data.shape[1]))
+        new_data[:, :self.__n] = self.__data[:, :self.__n]
+        self.__data = new_data
+
+    def __getitem__(self, column):
+
+        # returns a view on the recorded values, no copy is made
+        return self.__data[self.__index[column], :self.__n]
+
+    def __contains__(self, column):
+
+        return column in self.__index
+
+    def __len__(self):
+
+        return self.__n
+
+    def row(self, i):
+
+        return dict(zip(self.columns, self.__data[:, :self.__n][:, i]))
+
+    def as_dict(self):
+
+        return {column: self[column].copy() for column in self.columns}
+
+    def as_array(self):
+
+        return self.__data[:, :self.__n].copy()
+
+    def fork(self):
+
+        return TrajectoryRecorder.from_state(self.get_state())
+
+    def get_state(self) -> dict:
+
+        return {
+
+            "columns": list(self.columns),
+            "data": self.as_array()
+
+        }
+
+    @classmethod
+    def from_state(cls, state: dict):
+
+        data = state["data"]
+        recorder = cls(state["columns"], initial_size=2 * data.shape[1])
+
+        recorder.__data[:, :data.shape[1]] = data
+        recorder.__n = data.shape[1]
+
+        return recorder
@@ -1,7 +1,34 @@
 from abc import ABC, abstractmethod
-import matplotlib.pyplot as plt
-import scipy.constants as cst
+import copy
+from RocketModel.Support.checkpoint import save_checkpoint, load_checkpoint, has_checkpoint, remove_checkpoint
+from RocketModel.Support.trajectory import TrajectoryRecorder
+from RocketModel.constants import g, P_amb
 import numpy as np
+import hashlib
+import json
+import math
+
+
+class InvalidStateError(ValueError):
+
+    pass
+
+
+def is_valid(value):
+
+    # None (property not available) and nan are invalid states
+    return value is not None and not math.isnan(value)
+
+
+def scalar_attributes(obj) -> dict:
+
+    # public numeric / string parameters, used to fingerprint a configuration
+    return {
+
+        key: value for key, value in vars(obj).items()
+        if not key.startswith("_") and isinstance(value, (bool, int, float, str))
+
+    }
 
 
 class AbstractRocketGeometry(ABC):
@@ -12,20 +39,44 @@ class AbstractRocketGeometry(ABC):
 
         self.d_max = 0.08
         self.d_nozzle = 0.025
-        self.A_max = np.pi * np.power(self.d_max / 2, 2)
-        self.A_nozzle = np.pi * np.power(self.d_nozzle / 2, 2)
 
         self.m_bottle = 0.05
-        self.V_bottle = 1.5
+        self.V_bottle = 1.5  # [l]
+
+    @property
+    def d_max(self):
+        return self.__d_max
+
+    @d_max.setter
+    def d_max(self, d_max):
+
+        # areas are updated here and not evaluated at every step
+        self.__d_max = d_max
+        self.A_max = np.pi * np.power(d_max / 2, 2)
+
+    @property
+    def d_nozzle(self):
+        return self.__d_nozzle
+
+    @d_nozzle.setter
+    def d_nozzle(self, d_nozzle):
+
+        self.__d_nozzle = d_nozzle
+        self.A_nozzle = np.pi * np.power(d_nozzle / 2, 2)
 
     @property
     def V_bottle(self):
-        # convert l -> m^3
-        return self.__V_bottle * 0.001
+        return self.V_bottle_m3 * 10 ** 3
 
     @V_bottle.setter
     def V_bottle(self, volume):
-        self.__V_bottle = volume
+
+        # user-facing value in [l], converted once: the model reads V_bottle_m3
+        self.V_bottle_m3 = volume * 10 ** -3
+
+    def get_fingerprint(self) -> dict:
+
+        return scalar_attributes(self)
 
     @abstractmethod
     def get_free_surface_h(self, fill_perc):
@@ -34,58 +85,100 @@ class AbstractRocketGeometry(ABC):
 
 class AbstractRocketStatus(ABC):
 
-    def __init__(self, geometry:AbstractRocketGeometry, P_0, T_0, fill_start):
+    def __init__(self, geometry:AbstractRocketGeometry, P_0, T_0, fill_start, strict=False):
 
         self.geom = geometry
 
-        self.P_in = P_0
-        self.T_in = T_0
-        self.P_amb = 0.101325
+        # strict: raise InvalidStateError on the first invalid state, otherwise
+        # the state is clamped and counted in clamp_counters
+        self.strict = strict
+        self.clamp_counters = dict()
+
+        # P_0 [MPa] and T_0 [°C] are converted here, the model works in SI
+        self.P_in = P_0 * 10 ** 6
+        self.T_in = T_0 + 273.15
+        self.P_amb = P_amb
+        self.fill_start = fill_start
 
         self.__init_fluids(fill_start)
         self.__init_other_parameters()
         self.__calc_theoretical_h_max()
         self.__append_report_row()
 
+    def __initial_state_is_valid(self):
+
+        # a rocket without gas or below ambient pressure would silently fly a
+        # zero-thrust trajectory
+        if not self.gas.vol > 0:
+
+            self.__invalid_state("initial_state", "no initial gas volume (V_gas = {} m^3)".format(self.gas.vol))
+            return False
+
+        if not self.P_in > self.P_amb:
+
+            self.__invalid_state(
+
+                "initial_state",
+                "initial pressure not above ambient (P_0 = {} Pa, P_amb = {} Pa)".format(self.P_in, self.P_amb)
+
+            )
+            return False
+
+        return True
+
     def __calc_theoretical_h_max(self):
 
-        P_amb = 0.101325  # [Mpa]
+        if not self.__initial_state_is_valid():
+
+            self.w_exp = 0.
+            self.eta_exp = 0.
+            self.max_z_theory = 0.
+            return
 
         P_start = self.gas.get_variable("P")
         v_start = self.gas.vol
 
-        try:
-
-            gamma = self.gas.get_variable("gamma")
+        gamma = self.gas.get_variable("gamma")
 
-        except:
+        if gamma is None:
 
+            # backend without gamma (e.g. REFPROP): diatomic gas value
+            self.__count_clamp("default_gamma")
             gamma = 1.4
 
         fill_om = 1/np.power(gamma, 1/(gamma - 1))
-        overall_max = abs(self.geom.V_bottle * P_start * (np.power(fill_om, gamma) - fill_om) / (1 - gamma)) * 10 ** 6
+        overall_max = abs(self.geom.V_bottle_m3 * P_start * (np.power(fill_om, gamma) - fill_om) / (1 - gamma))
 
-        v_end = np.min([self.geom.V_bottle, v_start * np.power(P_start / P_amb, 1 / gamma)])
+        v_end = np.min([self.geom.V_bottle_m3, v_start * np.power(P_start / self.P_amb, 1 / gamma)])
         P_end = P_start * np.power(v_start / v_end, gamma)
 
-        self.w_exp = abs((P_start * v_start - P_end * v_end) / (1 - gamma)) * 10 ** 6  # [MJ] -> [J]
+        self.w_exp = abs((P_start * v_start - P_end * v_end) / (1 - gamma))  # [J]
         self.eta_exp = self.w_exp / overall_max
 
-        if v_end == self.geom.V_bottle:
+        if v_end == self.geom.V_bottle_m3:
 
-            self.max_z_theory = self.w_exp / (self.geom.m_bottle * cst.g)
+            self.max_z_theory = self.w_exp / (self.geom.m_bottle * g)
 
         else:
 
-            d_v = abs(v_end - self.geom.V_bottle)
+            d_v = abs(v_end - self.geom.V_bottle_m3)
             d_m = d_v * self.liquid.get_variable("rho")
-            self.max_z_theory = self.w_exp / ((self.geom.m_bottle + d_m) * cst.g)
+            self.max_z_theory = self.w_exp / ((self.geom.m_bottle + d_m) * g)
+
+        if not (math.isfinite(self.w_exp) and math.isfinite(self.eta_exp)):
+
+            self.__invalid_state(
+
+                "initial_state",
+                "non finite expansion work (w_exp = {} J, eta_exp = {})".format(self.w_exp, self.eta_exp)
+
+            )
 
     def __init_fluids(self, fill_start):
 
         self.__fill_perc = fill_start
-        liquid_volume = self.geom.V_bottle * fill_start
-        gas_volume = self.geom.V_bottle * (1 - fill_start)
+        liquid_volume = self.geom.V_bottle_m3 * fill_start
+        gas_volume = self.geom.V_bottle_m3 * (1 - fill_start)
 
         self.liquid = self.liquid_properties_class(liquid_volume, self.P_in, self.T_in)
         self.gas = self.gas_properties_class(gas_volume, self.P_in, self.T_in)
@@ -93,8 +186,7 @@ class AbstractRocketStatus(ABC):
     def __init_other_parameters(self):
 
         self.__time = 0.
-        self.__calculate_m_dot()
-        self.__dynamics_report = list()
+        self.trajectory = None
         self.__dynamics = {
 
             "a": 0.,
@@ -102,14 +194,53 @@ class AbstractRocketStatus(ABC):
             "z": 0.
 
         }
+        self.__calculate_m_dot()
+
+    def calculate(self, checkpoint_path=None, checkpoint_interval=100000):
+
+        if has_checkpoint(checkpoint_path):
 
-    def calculate(self):
+            load_checkpoint(self, checkpoint_path)
+
+        n_steps = 0
 
         while not self.has_landed:
 
             dt = self.get_dt()
             self.step(dt)
 
+            n_steps += 1
+
+            if checkpoint_path is not None and n_steps % checkpoint_interval == 0:
+
+                save_checkpoint(self, checkpoint_path)
+
+        # a completed run leaves no checkpoint behind, so that a later call
+        # computes the trajectory again instead of returning the stored one
+        remove_checkpoint(checkpoint_path)
+
+    def calculate_until(self, condition):
+
+        while not (self.has_landed or condition(self)):
+
+            dt = self.get_dt()
+            self.step(dt)
+
+    def fork(self):
+
+        # fluids and trajectory are duplicated, the geometry is copied so that
+        # each branch can change its own parameters (e.g. Cd) after the fork
+        new_rocket = copy.copy(self)
+
+        new_rocket.geom = copy.copy(self.geom)
+        new_rocket.liquid = self.liquid.fork()
+        new_rocket.gas = self.gas.fork()
+        new_rocket.trajectory = self.trajectory.fork()
+        new_rocket.__dynamics = dict(self.__dynamics)
+        new_rocket.clamp_counters = dict(self.clamp_counters)
+
+        return new_rocket
+
     def step(self, dt):
 
         self.__calculate_m_dot()
@@ -117,36 +248,131 @@ class AbstractRocketStatus(ABC):
         self.__update_pressures(dt)
         self.__append_report_row()
 
+    def get_state(self) -> dict:
+
+        return {
+
+            "time": self.__time,
+            "m_dot": self.__m_dot,
+            "fill_perc": self.__fill_perc,
+            "dynamics": dict(self.__dynamics),
+            "liquid": self.liquid.get_state(),
+            "gas": self.gas.get_state(),
+            "trajectory": self.trajectory.get_state(),
+            "clamp_counters": dict(self.clamp_counters)
+
+        }
+
+    def set_state(self, state: dict):
+
+        self.__time = state["time"]
+        self.__m_dot = state["m_dot"]
+        self.__fill_perc = state["fill_perc"]
+        self.__dynamics = dict(state["dynamics"])
+
+        self.liquid.set_state(state["liquid"])
+        self.gas.set_state(state["gas"])
+        self.trajectory = TrajectoryRecorder.from_state(state["trajectory"])
+        self.clamp_counters = dict(state["clamp_counters"])
+
     def __calculate_m_dot(self):
 
-        try:
+        P_gas = self.gas.get_variable("P")
 
-            if not self.out_of_liquid:
+        if not is_valid(P_gas):
 
-                rho = self.liquid.get_variable("rho")
+            self.__invalid_state("gas_state", "invalid gas pressure (P = {})".format(P_gas))
+            self.__m_dot = 0.
+            return
 
-                DP_gas = (self.gas.get_variable("P") - self.P_amb) * 10 ** 6  # [MPa] -> [Pa]
-                DP_acc = rho * (cst.g + self.__dynamics["a"]) * self.geom.get_free_surface_h(self.__fill_perc)
-                DP_overall = DP_gas + DP_acc
+        if not self.out_of_liquid:
 
-            elif not self.out_of_gas:
+            rho = self.liquid.get_variable("rho")
+            h_free_surface = self.geom.get_free_surface_h(self.__fill_perc)
 
-                rho = self.gas.get_variable("rho")
+            if not (is_valid(rho) and is_valid(h_free_surface)):
 
-                DP_gas = (self.gas.get_variable("P") - self.P_amb) * 10 ** 6  # [MPa] -> [Pa]
-                DP_overall = DP_gas
+                self.__invalid_state(
 
-            else:
+                    "liquid_state",
+                    "invalid liquid density or free surface height (rho = {}, h = {})".format(rho, h_free_surface)
 
+                )
                 self.__m_dot = 0.
                 return
 
-            beta = self.evaluate_pressure_losses_beta()
-            self.__m_dot = self.geom.A_nozzle * np.power(2 * rho * (1 + beta) * DP_overall, 1 / 2)
+            DP_gas = self.gas.get_variable("P") - self.P_amb
+            DP_acc = rho * (g + self.__dynamics["a"]) * h_free_surface
+            DP_overall = DP_gas + DP_acc
+
+        elif not self.out_of_gas:
+
+            rho = self.gas.get_variable("rho")
+
+            if not is_valid(rho):
 
-        except:
+                self.__invalid_state("gas_state", "invalid gas density (rho = {})".format(rho))
+                self.__m_dot = 0.
+                return
 
+            DP_gas = self.gas.get_variable("P") - self.P_amb
+            DP_overall = DP_gas
+
+        else:
+
+            self.__m_dot = 0.
+            return
+
+        beta = self.evaluate_pressure_losses_beta()
+        sqrt_arg = 2 * rho * (1 + beta) * DP_overall
+
+        # "not >" is also True for nan
+        if not sqrt_arg > 0:
+
+            self.__invalid_state(
+
+                "m_dot",
+                "non positive flow rate argument (rho = {}, beta = {}, DP = {} Pa)".format(rho, beta, DP_overall)
+
+            )
             self.__m_dot = 0.
+            return
+
+        self.__m_dot = self.geom.A_nozzle * math.sqrt(sqrt_arg)
+
+    def __outflow_density(self):
+
+        # density of the fluid leaving the nozzle, None when no valid outflow
+        # exists (the invalid state has already been handled by __calculate_m_dot)
+        if self.__m_dot == 0:
+
+            return None
+
+        if not self.out_of_liquid:
+
+            rho = self.liquid.get_variable("rho")
+
+        else:
+
+            rho = self.gas.get_variable("rho")
+
+        if not (is_valid(rho) and rho > 0):
+
+            return None
+
+        return rho
+
+    def __invalid_state(self, condition, message):
+
+        if self.strict:
+
+            raise InvalidStateError("{} at t = {} s: {}".format(condition, self.__time, message))
+
+        self.__count_clamp(condition)
+
+    def __count_clamp(self, condition):
+
+        self.clamp_counters[condition] = self.clamp_counters.get(condition, 0) + 1
 
     def __update_dynamics(self, dt):
 
@@ -157,78 +383,111 @@ class AbstractRocketStatus(ABC):
         self.__dynamics["v"] += self.__dynamics["a"] * dt
         self.__dynamics["z"] += 1/2 * self.__dynamics["a"] * np.power(dt, 2) + v_0 * dt
 
+        if not all(math.isfinite(value) for value in self.__dynamics.values()):
+
+            # has_landed treats a non finite altitude as terminal
+            self.__invalid_state("dynamics", "non finite dynamics ({})".format(self.__dynamics))
+
     def __update_pressures(self, dt):
 
         m_out = self.__m_dot * dt
+        rho = self.__outflow_density()
 
-        if not self.out_of_liquid:
+        if rho is None:
+
+            pass
+
+        elif not self.out_of_liquid:
 
-            self.liquid.vol -= m_out / self.liquid.get_variable("rho")
-            self.gas.vol = self.geom.V_bottle - self.liquid.vol
+            self.liquid.vol -= m_out / rho
+            self.gas.vol = self.geom.V_bottle_m3 - self.liquid.vol
 
         elif not self.out_of_gas:
 
             self.gas.mass -= m_out
 
-        self.__fill_perc = self.liquid.vol / self.geom.V_bottle
+        self.__fill_perc = self.liquid.vol / self.geom.V_bottle_m3
 
     def __append_report_row(self):
 
-        self.__dynamics_report.append({
+        P_gas = self.gas.get_variable("P")
+
+        row = {
 
             "time": self.__time,
             "m_dot": self.__m_dot,
             "level": self.__fill_perc,
-            "pressure": self.gas.get_variable("P"),
-            "dynamics": {
+            "pressure": P_gas if is_valid(P_gas) else np.nan,
+            "a": self.__dynamics["a"],
+            "v": self.__dynamics["v"],
+            "z": self.__dynamics["z"]
+
+        }
+        row.update(self.other_report_dict())
 
-                "a": self.__dynamics["a"],
-                "v": self.__dynamics["v"],
-                "z": self.__dynamics["z"]
+        if self.trajectory is None:
 
-            }
+            self.trajectory = TrajectoryRecorder(row.keys())
 
-        })
-        self.__dynamics_report[-1].update(self.other_report_dict())
+        self.trajectory.append(list(row.values()))
 
     def __calculate_forces(self):
 
-        if not self.out_of_liquid:
+        rho = self.__outflow_density()
 
-            rho = self.liquid.get_variable("rho")
+        if rho is None:
+
+            nozzle_force = 0.
 
         else:
 
-            rho = self.gas.get_variable("rho")
+            v_exit = self.__m_dot / (self.geom.A_nozzle * rho) - self.__dynamics["v"]
+            nozzle_force = v_exit * self.__m_dot
 
-        v_exit = self.__m_dot / (self.geom.A_nozzle * rho) - self.__dynamics["v"]
-        nozzle_force = v_exit * self.__m_dot
-        gravity = self.m_tot * cst.g
+        gravity = self.m_tot * g
 
         return nozzle_force - gravity + self.calculate_external_forces()
 
-    def print_over_time(self, element_name="dynamics", dynamic_element="z"):
+    def dense_trajectory(self):
 
-        t_list = list()
-        y_list = list()
+        from RocketModel.Support.dense_output import DenseTrajectory
+        return DenseTrajectory(self.trajectory)
 
-        for element in self.__dynamics_report:
+    def print_over_time(self, element_name="dynamics", dynamic_element="z", show=True):
 
-            t_list.append(element["time"])
+        from Visualization.plot_functions import plot_trajectory
 
-            if element_name == "dynamics":
+        if element_name == "dynamics":
 
-                y_list.append(element[element_name][dynamic_element])
+            column = dynamic_element
 
-            else:
+        else:
+
+            column = element_name
+
+        return plot_trajectory(
+
+            self.trajectory["time"], self.trajectory[column] * self.__return_scale(element_name),
+            x_label=self.__return_label("time"),
+            y_label=self.__return_label(element_name, dynamic_element),
+            label="optimal", show=show
+
+        )
+
+    def __return_scale(self, element_name):
+
+        # conversion from the SI values stored in the trajectory to the plot units
+        if element_name == "pressure":
+
+            return 10 ** -6  # [Pa] -> [MPa]
 
-                y_list.append(element[element_name])
+        elif element_name == "level":
+
+            return 100.
 
-        plt.plot(t_list, y_list, label="optimal")
+        else:
 
-        plt.xlabel(self.__return_label("time"))
-        plt.ylabel(self.__return_label(element_name, dynamic_element))
-        plt.show()
+            return 1.
 
     def __return_label(self, element_name, dynamic_element="z"):
 
@@ -302,6 +561,45 @@ class AbstractRocketStatus(ABC):
 
         return mass
 
+    @property
+    def fingerprint(self):
+
+        # identifies the configuration (rocket and geometry parameters) that a
+        # checkpoint belongs to
+        description = {
+
+            "class": type(self).__name__,
+            "rocket": scalar_attributes(self),
+            "geometry": self.geom.get_fingerprint()
+
+        }
+
+        return hashlib.sha1(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+    @property
+    def clamp_report(self) -> dict:
+
+        report = dict(self.clamp_counters)
+        report["liquid_clamped"] = self.liquid.n_clamped
+        report["gas_clamped"] = self.gas.n_clamped
+
+        return report
+
+    @property
+    def time(self):
+
+        return self.__time
+
+    @property
+    def altitude(self):
+
+        return self.__dynamics["z"]
+
+    @property
+    def velocity(self):
+
+        return self.__dynamics["v"]
+
     @property
     def has_landed(self):
 
@@ -311,7 +609,9 @@ class AbstractRocketStatus(ABC):
 
         else:
 
-            return self.__dynamics["z"] <= 0.
+            # a non finite altitude (invalid state in non strict mode) ends the run
+            z = self.__dynamics["z"]
+            return not math.isfinite(z) or z <= 0.
 
     @property
     def out_of_liquid(self):
@@ -323,12 +623,24 @@ class AbstractRocketStatus(ABC):
         else:
 
             rho = self.liquid.get_variable("rho")
-            DP_gas = (self.gas.get_variable("P") - self.P_amb)
-            DP_acc = rho * (cst.g + self.__dynamics["a"]) * self.geom.get_free_surface_h(self.__fill_perc) / 10 ** 6
+            h_free_surface = self.geom.get_free_surface_h(self.__fill_perc)
+            DP_gas = self.gas.get_variable("P") - self.P_amb
+
+            if is_valid(rho) and is_valid(h_free_surface):
+
+                DP_acc = rho * (g + self.__dynamics["a"]) * h_free_surface
+
+            else:
+
+                # the invalid state is reported (or raised) by the flow rate evaluation
+                DP_acc = 0.
 
             return DP_gas + DP_acc <= 0
 
     @property
     def out_of_gas(self):
 
-        return self.gas.get_variable("P") <= self.P_amb or self.gas.mass == 0
\ No newline at end of file
+        P_gas = self.gas.get_variable("P")
+
+        # an invalid gas pressure cannot push anything out of the bottle
+        return not is_valid(P_gas) or P_gas <= self.P_amb or self.gas.mass == 0
\ No newline at end of file
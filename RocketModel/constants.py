@@ -0,0 +1,2 @@
+g = 9.80665         # [m/s^2] standard gravity
+P_amb = 101325.     # [Pa] standard atmospheric pressure
@@ -0,0 +1,123 @@
+import numpy as np
+
+
+def get_pyplot():
+
+    # matplotlib is imported here (and not at module level) so that the
+    # numerical packages can be used without loading the plotting stack
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def decimate_min_max(x, y, n_bins):
+
+    """
+        Reduces (x, y) to at most 2 * n_bins + 2 points keeping, for each bin of
+        consecutive samples, the minimum and the maximum of y (in their original
+        order). The envelope of the curve is therefore preserved at screen resolution.
+    """
+
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(y)
+
+    if n_bins < 1 or n <= 2 * n_bins + 2:
+
+        return x, y
+
+    bin_size = int(np.ceil(n / n_bins))
+    n_bins = int(np.ceil(n / bin_size))
+
+    # pad with the last value so that the samples can be reshaped in bins
+    padded = np.empty(n_bins * bin_size, dtype=y.dtype)
+    padded[:n] = y
+    padded[n:] = y[-1]
+    padded = padded.reshape((n_bins, bin_size))
+
+    offsets = np.arange(n_bins) * bin_size
+    i_min = np.argmin(padded, axis=1) + offsets
+    i_max = np.argmax(padded, axis=1) + offsets
+
+    indices = np.sort(np.stack((i_min, i_max), axis=1), axis=1).ravel()
+    indices = np.concatenate(([0], np.minimum(indices, n - 1), [n - 1]))
+    indices = indices[np.concatenate(([True], np.diff(indices) != 0))]
+
+    return x[indices], y[indices]
+
+
+def screen_bins(ax):
+
+    figure = ax.figure
+    return int(figure.get_figwidth() * figure.dpi)
+
+
+def plot_trajectory(
+
+        t, y, x_label="", y_label="",
+        label=None, n_bins=None, ax=None, show=True
+
+):
+
+    plt = get_pyplot()
+
+    if ax is None:
+        ax = plt.gca()
+
+    if n_bins is None:
+        n_bins = screen_bins(ax)
+
+    t_plot, y_plot = decimate_min_max(t, y, n_bins)
+    ax.plot(t_plot, y_plot, label=label)
+
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+
+    if show:
+        plt.show()
+
+    return ax
+
+
+def plot_ensemble(
+
+        trajectories, column, time_column="time",
+        x_label="", y_label="", n_bins=None,
+        ax=None, show=True, **line_kwargs
+
+):
+
+    """
+        Overlays many runs (e.g. a sweep or a Monte Carlo ensemble) as a single
+        LineCollection. "trajectories" can be any iterable of columnar objects
+        indexed by column name (TrajectoryRecorder or dict of arrays).
+    """
+
+    plt = get_pyplot()
+    from matplotlib.collections import LineCollection
+
+    if ax is None:
+        ax = plt.gca()
+
+    if n_bins is None:
+        n_bins = screen_bins(ax)
+
+    segments = list()
+
+    for trajectory in trajectories:
+
+        t_plot, y_plot = decimate_min_max(trajectory[time_column], trajectory[column], n_bins)
+        segments.append(np.column_stack((t_plot, y_plot)))
+
+    line_kwargs.setdefault("linewidths", 0.5)
+    line_kwargs.setdefault("alpha", 0.5)
+
+    ax.add_collection(LineCollection(segments, **line_kwargs))
+    ax.autoscale_view()
+
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+
+    if show:
+        plt.show()
+
+    return ax
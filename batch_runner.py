@@ -0,0 +1,24 @@
+from RocketModel.Support.job_file import load_job, expand_job, run_job
+import argparse
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="run a water rocket study described by a job file")
+    parser.add_argument("job_file", help="job description (.toml, .json, .yaml)")
+    parser.add_argument("--output", default=None, help="output directory (overrides the job file)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (overrides the job file)")
+    parser.add_argument("--dry-run", action="store_true", help="only print the expanded configurations")
+    args = parser.parse_args()
+
+    job = load_job(args.job_file)
+
+    if args.dry_run:
+
+        for point, config in expand_job(job):
+            print(point, config)
+
+    else:
+
+        rows = run_job(job, output_dir=args.output, n_workers=args.workers)
+        print("{} points completed".format(len(rows)))